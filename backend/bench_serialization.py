@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the CPU cost of encoding list responses.
+
+Compares FastAPI's default response_model path (validate every document,
+convert to JSON-able Python, encode with the stdlib json module) with the
+TrustedListResponse path server.py uses for /articles/all and /subscribers.
+No database is needed: documents are synthesised in the shape Mongo returns.
+
+    python bench_serialization.py --articles 1000 --subscribers 1000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+import server
+
+
+def make_articles(count: int) -> list:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Article {i}: how sleep shapes focus",
+            "slug": f"article-{i}",
+            "excerpt": "A short summary of the article shown on cards and list pages. " * 2,
+            "category_id": str(uuid.uuid4()),
+            "featured_image": "https://images.unsplash.com/photo-1758243954982-cd1d5a8b9f97?w=600",
+            "meta_title": f"Article {i} | RestfulMind",
+            "meta_description": "Meta description for search engines.",
+            "is_featured": i % 5 == 0,
+            "is_published": True,
+            "reading_time": 6,
+            "whats_new": None,
+            "created_at": now - timedelta(hours=i),
+            "updated_at": now - timedelta(hours=i // 2),
+            "views": i * 7,
+        }
+        for i in range(count)
+    ]
+
+
+def make_subscribers(count: int) -> list:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "email": f"reader{i}@example.com",
+            "interests": ["sleep", "productivity"][: 1 + i % 2],
+            "gdpr_consent": True,
+            "subscribed_at": now - timedelta(minutes=i),
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+def default_path(docs: list, adapter: TypeAdapter) -> bytes:
+    """What FastAPI does with response_model: validate, dump to JSON-able Python, json.dumps."""
+    models = adapter.validate_python(docs)
+    content = adapter.dump_python(models, mode="json", exclude_unset=True)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(docs: list, adapter: TypeAdapter) -> bytes:
+    return server.TrustedListResponse(docs, adapter).body
+
+
+def cpu_ms(fn, docs, adapter, repeat: int) -> float:
+    fn(docs, adapter)  # warm up
+    started = time.process_time()
+    for _ in range(repeat):
+        fn(docs, adapter)
+    return (time.process_time() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    cases = [
+        ("/articles/all", make_articles(args.articles), TypeAdapter(List[server.ArticleSummary])),
+        ("/subscribers", make_subscribers(args.subscribers), TypeAdapter(List[server.Subscriber])),
+    ]
+    encoder = "orjson" if server.orjson is not None else "pydantic TypeAdapter"
+    print(f"Fast path encoder: {encoder}")
+    for route, docs, adapter in cases:
+        default_ms = cpu_ms(default_path, docs, adapter, args.repeat)
+        fast_ms = cpu_ms(fast_path, docs, adapter, args.repeat)
+        print(
+            f"{route:<15} {len(docs):>6} docs  default {default_ms:8.2f} ms  "
+            f"fast {fast_ms:8.2f} ms  saved {default_ms - fast_ms:8.2f} ms/request ({default_ms / fast_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Export the public read API as static files a CDN or nginx can serve.
+
+Every public GET route is called in-process against the FastAPI app (so the
+bytes are exactly what the API would send) and written under the output
+directory, mirroring the URL path:
+
+    /api/articles                   -> api/articles/index.json
+    /api/articles?category=x        -> api/articles/category=x.json
+    /api/articles/some-slug         -> api/articles/some-slug/index.json
+    /api/sitemap.xml                -> api/sitemap.xml
+
+which nginx can map with `try_files $uri $uri/index.json $uri/$args.json`.
+
+List routes, sitemap chunks and every article's related list are re-exported
+on every run (all are served from memory). Article pages are only
+re-exported when the article changed since the previous snapshot, or when
+any category changed, since pages embed their category (both tracked in
+.snapshot-manifest.json). Articles that were deleted or unpublished have
+their files removed. Use --full to export everything again.
+
+    python export_snapshot.py --out ../snapshot --concurrency 16
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import server
+
+MANIFEST_NAME = ".snapshot-manifest.json"
+ARTICLE_LIST_QUERIES = ["", "limit=12"]
+CATEGORY_ARTICLE_QUERIES = ["category={slug}", "category={slug}&limit=4"]
+STATIC_PAGES = ["privacy", "terms", "disclaimer"]
+
+
+async def call_app(path: str, query: str = ""):
+    """Run one GET through the ASGI app and return (status, body)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": query.encode("utf-8"),
+        "headers": [(b"host", b"snapshot")],
+        "client": ("127.0.0.1", 0),
+        "server": ("snapshot", 80),
+    }
+    status = None
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await server.app(scope, receive, send)
+    return status, b"".join(body)
+
+
+def target_path(out: Path, path: str, query: str) -> Path:
+    relative = path.lstrip("/")
+    if relative.endswith(".xml"):
+        return out / relative
+    return out / relative / f"{query or 'index'}.json"
+
+
+def write_atomic(target: Path, body: bytes):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(body)
+    os.replace(tmp, target)
+
+
+class Exporter:
+    def __init__(self, out: Path, concurrency: int):
+        self.out = out
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.written = 0
+        self.failed = []
+
+    async def export(self, path: str, query: str = ""):
+        async with self.semaphore:
+            status, body = await call_app(path, query)
+        if status != 200:
+            self.failed.append((path, query, status))
+            return
+        await asyncio.to_thread(write_atomic, target_path(self.out, path, query), body)
+        self.written += 1
+
+    async def export_all(self, routes):
+        await asyncio.gather(*(self.export(path, query) for path, query in routes))
+
+
+def categories_fingerprint(categories) -> str:
+    encoded = json.dumps(sorted(categories, key=lambda category: category["id"]), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_manifest(out: Path) -> dict:
+    try:
+        return json.loads((out / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+async def run(out: Path, concurrency: int, full: bool) -> int:
+    started_at = datetime.now(timezone.utc)
+    manifest = {} if full else load_manifest(out)
+    since = datetime.fromisoformat(manifest["exported_at"]) if manifest.get("exported_at") else None
+    previous = manifest.get("articles", {})
+
+    # Load the in-memory tables the public routes read from. The view counter
+    # is never started or flushed here, so snapshot reads do not count as views.
+    await server.category_table.reload()
+    await server.static_content.reload()
+    await server.rebuild_related_index()
+    await server.reload_site_feeds()
+
+    articles = await server.db.articles.find(
+        {"is_published": True}, {"_id": 0, "id": 1, "slug": 1, "updated_at": 1}
+    ).to_list(None)
+    current = {art["slug"]: art["id"] for art in articles}
+    categories = categories_fingerprint(server.category_table.all())
+    everything = since is None or manifest.get("categories") != categories
+    changed = [
+        art["slug"] for art in articles
+        if everything or art["slug"] not in previous
+        or not isinstance(art.get("updated_at"), datetime) or art["updated_at"] > since
+    ]
+    removed = [slug for slug in previous if slug not in current]
+
+    routes = [("/api/categories", ""), ("/api/articles/weekly-updates", ""),
+              ("/api/sitemap.xml", ""), ("/api/feed.xml", "")]
+    routes += [("/api/articles", query) for query in ARTICLE_LIST_QUERIES]
+    routes += [(f"/api/content/{page}", "") for page in STATIC_PAGES]
+    for category in server.category_table.all():
+        routes.append((f"/api/categories/{category['slug']}", ""))
+        routes += [("/api/articles", query.format(slug=category["slug"])) for query in CATEGORY_ARTICLE_QUERIES]
+    chunks = server.site_feeds.sitemap_chunks()
+    if chunks > 1:
+        routes += [(f"/api/sitemap-{n}.xml", "") for n in range(1, chunks + 1)]
+    # Any write can change other articles' "read next" lists, so export them all
+    routes += [(f"/api/articles/{slug}/related", "") for slug in current]
+    routes += [(f"/api/articles/{slug}", "") for slug in changed]
+
+    exporter = Exporter(out, concurrency)
+    clock = time.perf_counter()
+    await exporter.export_all(routes)
+    for slug in removed:
+        shutil.rmtree(out / "api" / "articles" / slug, ignore_errors=True)
+    for stale in (out / "api").glob("sitemap-*.xml"):
+        number = stale.stem.rsplit("-", 1)[1]
+        if chunks == 1 or not number.isdigit() or int(number) > chunks:
+            stale.unlink()
+
+    if not exporter.failed:
+        write_atomic(out / MANIFEST_NAME, json.dumps(
+            {"exported_at": started_at.isoformat(), "categories": categories, "articles": current}, indent=2
+        ).encode("utf-8"))
+    print(
+        f"Exported {exporter.written} files ({len(changed)} changed articles, "
+        f"{len(removed)} removed) to {out} in {time.perf_counter() - clock:.2f}s"
+    )
+    for path, query, status in exporter.failed:
+        print(f"  FAILED {status} {path}{'?' + query if query else ''}", file=sys.stderr)
+    return 1 if exporter.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the public API as static files.")
+    parser.add_argument("--out", type=Path, default=Path("snapshot"), help="output directory")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight at once")
+    parser.add_argument("--full", action="store_true", help="ignore the previous snapshot and export everything")
+    args = parser.parse_args()
+
+    async def export():
+        try:
+            return await run(args.out, args.concurrency, args.full)
+        finally:
+            server.auth_pool.shutdown()
+            server.client.close()
+
+    sys.exit(asyncio.run(export()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Prometheus metrics for the API: request latency per route, MongoDB command
+latency per collection and command, and connection pool checkouts.
+
+The text exposition format is small enough to render here, so there is no
+client library dependency. Metrics are process-local; with several uvicorn
+workers, scrape each worker (or run one per pod).
+
+    RequestMetricsMiddleware   ASGI middleware, labels by route template
+    MongoCommandMetrics        pymongo CommandListener
+    MongoPoolMetrics           pymongo ConnectionPoolListener
+    REGISTRY.render()          body for GET /metrics
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from pymongo import monitoring
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names, values) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self, kind: str = "counter"):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {kind}"
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{format_labels(self.labels, labels)} {value}"
+
+
+class Gauge(Counter):
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def render(self, kind: str = "gauge"):
+        return super().render(kind)
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, *labels, value: float):
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[slot] += 1
+            series[-1] += value
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self._series.items())
+        names = self.labels + ("le",)
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), values):
+                cumulative += count
+                yield f"{self.name}_bucket{format_labels(names, labels + (bound,))} {cumulative}"
+            yield f"{self.name}_sum{format_labels(self.labels, labels)} {values[-1]}"
+            yield f"{self.name}_count{format_labels(self.labels, labels)} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> bytes:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+REGISTRY = Registry()
+
+http_requests = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route template, method and status.",
+    ("method", "route", "status"),
+))
+http_latency = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Time from request start to the last body chunk.",
+    ("method", "route"),
+))
+http_in_flight = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "Requests currently being handled.",
+))
+mongo_commands = REGISTRY.register(Counter(
+    "mongodb_commands_total", "MongoDB commands by collection, command and outcome.",
+    ("collection", "command", "outcome"),
+))
+mongo_latency = REGISTRY.register(Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command round trip as reported by the driver.",
+    ("collection", "command"),
+))
+pool_checkouts = REGISTRY.register(Counter(
+    "mongodb_pool_checkouts_total", "Connection checkouts by server and outcome.",
+    ("address", "outcome"),
+))
+pool_wait = REGISTRY.register(Histogram(
+    "mongodb_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.",
+    ("address",),
+))
+pool_checked_out = REGISTRY.register(Gauge(
+    "mongodb_pool_checked_out_connections", "Connections currently checked out of the pool.",
+    ("address",),
+))
+pool_connections = REGISTRY.register(Gauge(
+    "mongodb_pool_open_connections", "Connections currently open in the pool.",
+    ("address",),
+))
+
+
+class RequestMetricsMiddleware:
+    """Times every HTTP request and labels it with the matched route's path
+    template (e.g. /api/articles/{slug}), so cardinality stays bounded."""
+
+    def __init__(self, app):
+        self.app = app
+        self._templates = None
+
+    def _route_template(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if self._templates is None:
+            # The router writes the matched endpoint into the shared scope;
+            # map it back to its path template once routes are all registered
+            self._templates = {
+                route.endpoint: route.path
+                for route in scope["app"].routes if hasattr(route, "endpoint")
+            }
+        return self._templates.get(endpoint, UNMATCHED_ROUTE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_in_flight.dec()
+            route = self._route_template(scope)
+            http_latency.observe(scope["method"], route, value=time.perf_counter() - start)
+            http_requests.inc(scope["method"], route, str(status))
+
+
+def command_collection(command_name: str, command) -> str:
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Per-collection, per-command latency. Events arrive on driver threads."""
+
+    def __init__(self):
+        self._pending = {}  # (connection_id, request_id) -> collection
+
+    def started(self, event):
+        self._pending[(event.connection_id, event.request_id)] = command_collection(
+            event.command_name, event.command
+        )
+
+    def succeeded(self, event):
+        self._finish(event, "ok")
+
+    def failed(self, event):
+        self._finish(event, "error")
+
+    def _finish(self, event, outcome: str):
+        collection = self._pending.pop((event.connection_id, event.request_id), "")
+        mongo_latency.observe(collection, event.command_name, value=event.duration_micros / 1e6)
+        mongo_commands.inc(collection, event.command_name, outcome)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Checkout wait time and pool occupancy per server.
+
+    The driver checks a connection out on the thread that runs the operation,
+    so the wait is measured between the started and checked-out events seen
+    by the same thread."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _address(self, event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        address = self._address(event)
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            pool_wait.observe(address, value=time.perf_counter() - started)
+            self._local.started = None
+        pool_checkouts.inc(address, "ok")
+        pool_checked_out.inc(address)
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+        pool_checkouts.inc(self._address(event), event.reason)
+
+    def connection_checked_in(self, event):
+        pool_checked_out.dec(self._address(event))
+
+    def connection_created(self, event):
+        pool_connections.inc(self._address(event))
+
+    def connection_closed(self, event):
+        pool_connections.dec(self._address(event))
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
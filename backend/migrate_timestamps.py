@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Convert timestamps stored as ISO-8601 strings into native BSON dates.
+
+Older versions of server.py and seed_data.py wrote every timestamp with
+`.isoformat()`. This walks each collection in `_id` order and rewrites the
+string fields in batches. Only documents that still hold a string match the
+query, so the migration can be stopped and re-run at any time. server.py
+starts it in the background on every boot; it can also be run by hand.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_FIELDS = {
+    "articles": ["created_at", "updated_at"],
+    "categories": ["created_at"],
+    "subscribers": ["subscribed_at"],
+    "users": ["created_at"],
+}
+
+BATCH_SIZE = 500
+
+
+def parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+async def migrate_collection(collection, fields, batch_size=BATCH_SIZE) -> int:
+    """Convert string timestamps in one collection, returning how many documents changed."""
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    projection = {field: 1 for field in fields}
+    last_id = None
+    migrated = 0
+    while True:
+        batch_query = query if last_id is None else {**query, "_id": {"$gt": last_id}}
+        docs = await collection.find(batch_query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not docs:
+            return migrated
+        last_id = docs[-1]["_id"]
+
+        ops = []
+        for doc in docs:
+            update = {}
+            for field in fields:
+                if not isinstance(doc.get(field), str):
+                    continue
+                try:
+                    update[field] = parse_timestamp(doc[field])
+                except ValueError:
+                    logger.warning("Skipping unparseable %s.%s on %s: %r", collection.name, field, doc["_id"], doc[field])
+            if update:
+                # Match the old string values so a concurrent write is never overwritten
+                match = {"_id": doc["_id"], **{field: doc[field] for field in update}}
+                ops.append(UpdateOne(match, {"$set": update}))
+        if ops:
+            result = await collection.bulk_write(ops, ordered=False)
+            migrated += result.modified_count
+
+
+async def migrate_timestamps(db, batch_size=BATCH_SIZE) -> dict:
+    """Run the migration over every collection in TIMESTAMP_FIELDS."""
+    totals = {}
+    for name, fields in TIMESTAMP_FIELDS.items():
+        totals[name] = await migrate_collection(db[name], fields, batch_size)
+        if totals[name]:
+            logger.info("Converted timestamps on %d %s", totals[name], name)
+    return totals
+
+
+async def main():
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    try:
+        totals = await migrate_timestamps(client[os.environ.get('DB_NAME', 'test_database')])
+        for name, count in totals.items():
+            print(f"  {name}: {count} documents converted")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+"""
+Precomputed "read next" recommendations based on TF-IDF cosine similarity.
+
+Each published article is reduced to its MAX_TERMS highest-weighted TF-IDF
+terms (L2-normalised) and stored in per-term postings of NumPy arrays.
+Scoring one article against the whole catalogue is then a handful of
+vectorised adds, which is what makes single-article refreshes cheap. The
+top-k neighbours of every article are kept in a table so serving them is a
+dict lookup.
+
+Incremental updates reuse the document frequencies as they stand, so term
+weights drift slightly from a fresh build as the catalogue changes; build()
+again (e.g. on restart) to reset them.
+"""
+
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+TOP_K = 5
+MAX_TERMS = 64
+TITLE_WEIGHT = 3
+EXCERPT_WEIGHT = 2
+
+TOKEN_RE = re.compile(r"[a-z][a-z'-]{2,}")
+STOPWORDS = frozenset("""
+    about above after again against all also and any are aren't because been before being below
+    between both but can can't cannot could did didn't does doesn't doing don't down during each
+    even every few for from further had has have having her here hers herself him himself his how
+    into isn't it's its itself just let's like made make makes many may more most much must not now
+    off once only other our ours ourselves out over own same she should some such than that the
+    their theirs them themselves then there these they this those through too under until very was
+    way ways well were what when where which while who whom why will with would you your yours
+    yourself yourselves
+""".split())
+
+SUMMARY_EXCLUDE = ("_id", "content", "search_text")
+
+
+def tokenize(text: str) -> list:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def term_counts(article: dict) -> Counter:
+    counts = Counter(tokenize(article.get("search_text") or ""))
+    for token in tokenize(article.get("excerpt") or ""):
+        counts[token] += EXCERPT_WEIGHT
+    for token in tokenize(article.get("title") or ""):
+        counts[token] += TITLE_WEIGHT
+    return counts
+
+
+class RelatedArticlesIndex:
+    """Top-k most similar published articles for every article."""
+
+    def __init__(self, top_k: int = TOP_K):
+        self.top_k = top_k
+        self._vocab = {}          # term -> column
+        self._df = Counter()      # column -> number of documents containing it
+        self._postings = {}       # column -> (rows int32 array, weights float32 array)
+        self._vectors = {}        # row -> (columns, weights) of that document
+        self._counts = {}         # row -> term counts, kept for df bookkeeping
+        self._rows = {}           # article id -> row
+        self._slugs = {}          # slug -> row
+        self._summaries = {}      # row -> article without content/search_text
+        self._neighbours = {}     # row -> [(score, row), ...] best first
+        self._next_row = 0
+
+    @classmethod
+    def build(cls, articles, top_k: int = TOP_K) -> "RelatedArticlesIndex":
+        index = cls(top_k)
+        counts = []
+        for article in articles:
+            row = index._claim_row(article)
+            counts.append((row, term_counts(article)))
+            index._counts[row] = counts[-1][1]
+            for term in counts[-1][1]:
+                index._df[index._column(term)] += 1
+        postings = {}
+        for row, article_counts in counts:
+            columns, weights = index._vectors[row] = index._vectorize(article_counts)
+            for column, weight in zip(columns.tolist(), weights.tolist()):
+                postings.setdefault(column, ([], []))
+                postings[column][0].append(row)
+                postings[column][1].append(weight)
+        index._postings = {
+            column: (np.array(rows, dtype=np.int32), np.array(weights, dtype=np.float32))
+            for column, (rows, weights) in postings.items()
+        }
+        for row in index._summaries:
+            index._neighbours[row] = index._top_k_for(row)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def related(self, slug: str) -> list:
+        """Neighbours of the article with this slug as (summary, score) pairs."""
+        row = self._slugs.get(slug)
+        if row is None:
+            return []
+        return [(self._summaries[other], score) for score, other in self._neighbours.get(row, [])]
+
+    def upsert(self, article: dict):
+        """Add or refresh one article and repair every neighbour list it affects."""
+        if article["id"] in self._rows:
+            self.remove(article["id"])
+        row = self._claim_row(article)
+        counts = term_counts(article)
+        self._counts[row] = counts
+        for term in counts:
+            self._df[self._column(term)] += 1
+        self._add_postings(row, self._vectorize(counts))
+
+        others, scores = self._scores(row)
+        self._neighbours[row] = self._best(others, scores)
+        for other, score in zip(others.tolist(), scores.tolist()):
+            neighbours = self._neighbours[other]
+            if len(neighbours) < self.top_k or score > neighbours[-1][0]:
+                neighbours.append((score, row))
+                neighbours.sort(reverse=True)
+                del neighbours[self.top_k:]
+
+    def remove(self, article_id: str):
+        row = self._rows.pop(article_id, None)
+        if row is None:
+            return
+        summary = self._summaries.pop(row)
+        self._slugs.pop(summary["slug"], None)
+        self._neighbours.pop(row, None)
+        columns, _ = self._vectors.pop(row)
+        for column in columns.tolist():
+            rows, weights = self._postings[column]
+            keep = rows != row
+            self._postings[column] = (rows[keep], weights[keep])
+        for term in self._counts.pop(row):
+            self._df[self._vocab[term]] -= 1
+        # Anyone who recommended the removed article needs a fresh list
+        for other, neighbours in self._neighbours.items():
+            if any(neighbour == row for _, neighbour in neighbours):
+                self._neighbours[other] = self._top_k_for(other)
+
+    def stats(self) -> dict:
+        return {"articles": len(self._summaries), "terms": len(self._vocab), "top_k": self.top_k}
+
+    def _claim_row(self, article: dict) -> int:
+        row = self._next_row
+        self._next_row += 1
+        self._rows[article["id"]] = row
+        self._slugs[article["slug"]] = row
+        self._summaries[row] = {key: value for key, value in article.items() if key not in SUMMARY_EXCLUDE}
+        return row
+
+    def _column(self, term: str) -> int:
+        column = self._vocab.get(term)
+        if column is None:
+            column = self._vocab[term] = len(self._vocab)
+        return column
+
+    def _vectorize(self, counts: Counter):
+        n_docs = len(self._summaries)
+        columns = np.fromiter((self._vocab[term] for term in counts), dtype=np.int64, count=len(counts))
+        tf = np.fromiter((1 + math.log(count) for count in counts.values()), dtype=np.float32, count=len(counts))
+        df = np.fromiter((self._df[column] for column in columns), dtype=np.float32, count=len(counts))
+        weights = tf * (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+        if len(weights) > MAX_TERMS:
+            keep = np.argpartition(weights, -MAX_TERMS)[-MAX_TERMS:]
+            columns, weights = columns[keep], weights[keep]
+        norm = np.linalg.norm(weights)
+        if norm:
+            weights = weights / norm
+        return columns, weights
+
+    def _add_postings(self, row: int, vector):
+        self._vectors[row] = vector
+        for column, weight in zip(vector[0].tolist(), vector[1].tolist()):
+            rows, weights = self._postings.get(column, (np.empty(0, np.int32), np.empty(0, np.float32)))
+            self._postings[column] = (np.append(rows, np.int32(row)), np.append(weights, np.float32(weight)))
+
+    def _scores(self, row: int):
+        """Cosine similarity of `row` to every article sharing a term with it,
+        as parallel (rows, scores) arrays. Only the postings touched are read."""
+        columns, query = self._vectors[row]
+        if not len(columns):
+            return np.empty(0, np.int32), np.empty(0, np.float32)
+        hits = [self._postings[column] for column in columns.tolist()]
+        rows = np.concatenate([rows for rows, _ in hits])
+        products = np.concatenate([weight * weights for weight, (_, weights) in zip(query, hits)])
+        others, positions = np.unique(rows, return_inverse=True)
+        scores = np.bincount(positions, weights=products).astype(np.float32)
+        keep = (others != row) & (scores > 0)
+        return others[keep], scores[keep]
+
+    def _best(self, others: np.ndarray, scores: np.ndarray) -> list:
+        if len(others) > self.top_k:
+            keep = np.argpartition(scores, -self.top_k)[-self.top_k:]
+            others, scores = others[keep], scores[keep]
+        return sorted(zip(scores.tolist(), others.tolist()), reverse=True)
+
+    def _top_k_for(self, row: int) -> list:
+        return self._best(*self._scores(row))
@@ -31,7 +31,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1758243954982-cd1d5a8b9f97?w=600",
         "meta_title": "Sleep & Rest Articles | RestfulMind",
         "meta_description": "Science-backed articles about sleep quality, sleep cycles, and rest for better health.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     },
     {
         "id": str(uuid.uuid4()),
@@ -41,7 +41,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1758274539654-23fa349cc090?w=600",
         "meta_title": "Mental Health Resources | RestfulMind",
         "meta_description": "Informational articles about mental wellness, emotional health, and psychological well-being.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     },
     {
         "id": str(uuid.uuid4()),
@@ -51,7 +51,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1665764356520-3daa0e8326b1?w=600",
         "meta_title": "Stress & Anxiety Management | RestfulMind",
         "meta_description": "Learn about stress management and anxiety relief through science-backed approaches.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     },
     {
         "id": str(uuid.uuid4()),
@@ -61,7 +61,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1700554565325-aea824405166?w=600",
         "meta_title": "Productivity & Focus Tips | RestfulMind",
         "meta_description": "Evidence-based strategies to improve focus, productivity, and work-life balance.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     },
     {
         "id": str(uuid.uuid4()),
@@ -71,7 +71,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1628743270481-123e2501e518?w=600",
         "meta_title": "Healthy Lifestyle & Habits | RestfulMind",
         "meta_description": "Articles about building healthy habits and lifestyle choices for better living.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     },
     {
         "id": str(uuid.uuid4()),
@@ -81,7 +81,7 @@ CATEGORIES = [
         "image_url": "https://images.unsplash.com/photo-1692035072849-93a511f35b2c?w=600",
         "meta_title": "Sleep & Mental Health Research | RestfulMind",
         "meta_description": "Scientific research and studies about sleep, mental health, and productivity explained.",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
 ]
 
@@ -1113,8 +1113,8 @@ def get_articles(categories):
         article["meta_description"] = article["excerpt"]
         # Stagger dates for variety
         days_ago = i * 2
-        article["created_at"] = (now - timedelta(days=days_ago)).isoformat()
-        article["updated_at"] = (now - timedelta(days=max(0, days_ago - 7))).isoformat()
+        article["created_at"] = now - timedelta(days=days_ago)
+        article["updated_at"] = now - timedelta(days=max(0, days_ago - 7))
         article["whats_new"] = "Updated with the latest research and practical recommendations." if i < 5 else None
     
     return articles
@@ -1153,11 +1153,15 @@ async def seed_database():
             "name": "Admin User",
             "password_hash": password_hash,
             "role": "admin",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
         await db.users.insert_one(admin_user)
         print(f"  Created admin user: admin@restfulmind.com / admin123")
         
+        # Drop the dashboard totals last; the server rebuilds them from the
+        # new data on its next dashboard read or startup
+        await db.counters.delete_many({})
+        
         print("\nDatabase seeded successfully!")
         print("\nAdmin credentials:")
         print("  Email: admin@restfulmind.com")
@@ -1,24 +1,68 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 import os
+import asyncio
 import logging
+import time
+import json
+import base64
+import hashlib
+import csv
+import io
+import codecs
+import gzip
+import re
+import html
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, ValidationError
 from typing import List, Optional
+from collections import OrderedDict, defaultdict
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 import bcrypt
 import jwt
 
+try:
+    import orjson
+except ImportError:  # optional: responses fall back to pydantic's JSON encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+from migrate_timestamps import migrate_timestamps
+from related_articles import RelatedArticlesIndex
+from site_feeds import SiteFeeds
+from slow_queries import SlowQueryLog
+from metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, MongoCommandMetrics, MongoPoolMetrics, RequestMetricsMiddleware
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Reads slower than this are logged; each query shape is explained at most
+# once per interval (0 turns explains off)
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', '100'))
+SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = float(os.environ.get('SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS', '300'))
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_MS, SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS)
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url, tz_aware=True,
+    event_listeners=[MongoCommandMetrics(), MongoPoolMetrics(), slow_query_log],
+)
 db = client[os.environ['DB_NAME']]
 
 # JWT Config
@@ -26,6 +70,36 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'restfulmind-secret-key-change-in-prod
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Auth crypto pool: bcrypt workers plus how many calls may wait for one
+AUTH_POOL_SIZE = int(os.environ.get('AUTH_POOL_SIZE', '4'))
+AUTH_POOL_QUEUE_LIMIT = int(os.environ.get('AUTH_POOL_QUEUE_LIMIT', '64'))
+
+# Encode trusted list responses directly instead of revalidating them
+FAST_JSON_RESPONSES = os.environ.get('FAST_JSON_RESPONSES', 'true').lower() == 'true'
+
+# Longest an ETag (and the precompressed body cached under it) stays valid,
+# so writes made by other workers or scripts show up within this time
+CONTENT_VERSION_MAX_AGE_SECONDS = int(os.environ.get('CONTENT_VERSION_MAX_AGE_SECONDS', '300'))
+
+# Precompressed public responses kept in memory, keyed by ETag
+COMPRESSED_CACHE_SIZE = int(os.environ.get('COMPRESSED_CACHE_SIZE', '512'))
+
+# Browser/CDN cache lifetime for the legal pages under /content
+STATIC_CONTENT_MAX_AGE = int(os.environ.get('STATIC_CONTENT_MAX_AGE', '86400'))
+
+# Longest the cached weekly-updates feed is served without a re-query
+WEEKLY_FEED_MAX_AGE_SECONDS = int(os.environ.get('WEEKLY_FEED_MAX_AGE_SECONDS', '3600'))
+
+# Public site address used for links in sitemap.xml and feed.xml
+SITE_URL = os.environ.get('SITE_URL', 'http://localhost:3000')
+
+# Authenticated principal cache
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.environ.get('PRINCIPAL_CACHE_TTL_SECONDS', '60'))
+PRINCIPAL_CACHE_SIZE = int(os.environ.get('PRINCIPAL_CACHE_SIZE', '1024'))
+
+# How often buffered article views are written back
+VIEW_FLUSH_INTERVAL_SECONDS = float(os.environ.get('VIEW_FLUSH_INTERVAL_SECONDS', '5'))
+
 # Create the main app
 app = FastAPI(title="RestfulMind API")
 
@@ -109,6 +183,27 @@ class Article(ArticleBase):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     views: int = 0
 
+class ArticleSummary(BaseModel):
+    """Article as returned by the list routes: everything but `content`,
+    which is only present when the caller asks for it with include=content."""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    title: str
+    slug: str
+    excerpt: str
+    category_id: str
+    featured_image: Optional[str] = None
+    meta_title: Optional[str] = None
+    meta_description: Optional[str] = None
+    is_featured: bool = False
+    is_published: bool = True
+    reading_time: int = 5
+    whats_new: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    views: int = 0
+    content: Optional[str] = None
+
 class SubscriberBase(BaseModel):
     email: EmailStr
     interests: List[str] = []
@@ -123,6 +218,91 @@ class Subscriber(SubscriberBase):
     subscribed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = True
 
+# ============ INDEXES ============
+
+# Every index the routes below rely on, keyed by collection. Compound indexes
+# follow the equality -> sort order of the query they serve so Mongo can walk
+# the index instead of sorting in memory. Keep this in sync when adding routes.
+INDEXES = {
+    "articles": [
+        IndexModel([("slug", ASCENDING)], name="slug_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # GET /articles (optionally filtered by category and/or featured), keyset on (created_at, id)
+        IndexModel([("is_published", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="published_created_id"),
+        IndexModel([("is_published", ASCENDING), ("category_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="published_category_created_id"),
+        IndexModel([("is_published", ASCENDING), ("is_featured", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="published_featured_created_id"),
+        # GET /articles/weekly-updates
+        IndexModel([("is_published", ASCENDING), ("updated_at", DESCENDING)], name="published_updated"),
+        # GET /articles/all
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_id"),
+        # GET /articles/search
+        IndexModel(
+            [("title", TEXT), ("excerpt", TEXT), ("search_text", TEXT)],
+            name="article_text",
+            weights={"title": 10, "excerpt": 4, "search_text": 1},
+        ),
+    ],
+    "categories": [
+        IndexModel([("slug", ASCENDING)], name="slug_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+    "subscribers": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("is_active", ASCENDING), ("interests", ASCENDING)], name="active_interests"),
+    ],
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+    "static_content": [
+        IndexModel([("type", ASCENDING)], name="type_unique", unique=True),
+    ],
+}
+
+# (collection, index name) of unique indexes ensure_indexes could not build.
+# Routes that rely on one for duplicate detection fall back to a find_one check.
+missing_unique_indexes = set()
+
+async def ensure_indexes():
+    """Create every index in INDEXES. A failing index (e.g. a unique index over
+    existing duplicates) is logged and skipped so the rest still get built."""
+    missing_unique_indexes.clear()
+    for collection, models in INDEXES.items():
+        for model in models:
+            try:
+                await db[collection].create_indexes([model])
+            except OperationFailure as e:
+                logger.error("Could not create index %s.%s: %s", collection, model.document["name"], e)
+                if model.document.get("unique"):
+                    missing_unique_indexes.add((collection, model.document["name"]))
+
+async def get_index_report():
+    """Compare the live indexes against INDEXES.
+
+    Returns, per collection, the declared indexes that are missing, the live
+    indexes nobody declared, and the indexes with no recorded use since the
+    server last restarted (None when the user lacks the indexStats privilege).
+    """
+    report = {}
+    for collection, models in INDEXES.items():
+        declared = {model.document["name"] for model in models}
+        live = set((await db[collection].index_information()).keys()) - {"_id_"}
+        try:
+            stats = await db[collection].aggregate([{"$indexStats": {}}]).to_list(None)
+            unused = sorted(
+                stat["name"] for stat in stats
+                if stat["name"] != "_id_" and stat["accesses"]["ops"] == 0
+            )
+        except OperationFailure:
+            unused = None
+        report[collection] = {
+            "missing": sorted(declared - live),
+            "undeclared": sorted(live - declared),
+            "unused": unused,
+        }
+    return report
+
 # ============ AUTH HELPERS ============
 
 def hash_password(password: str) -> str:
@@ -131,6 +311,106 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+class CryptoPool:
+    """Bounded thread pool for bcrypt so hashing never blocks the event loop.
+
+    bcrypt releases the GIL while it works, so threads run in parallel. Calls
+    beyond size + queue_limit are rejected with a 503 instead of piling up.
+    """
+
+    def __init__(self, size: int, queue_limit: int):
+        self.size = size
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="auth-crypto")
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn, *args):
+        if self.in_flight >= self.size + self.queue_limit:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Authentication is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "queue_limit": self.queue_limit,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.size),
+            "peak_in_flight": self.peak_in_flight,
+            "saturated": self.in_flight >= self.size,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+auth_pool = CryptoPool(AUTH_POOL_SIZE, AUTH_POOL_QUEUE_LIMIT)
+
+class PrincipalCache:
+    """LRU cache of token -> user document with a TTL.
+
+    Entries never outlive the token's own expiry. Changes made in this process
+    must call invalidate_user; changes made elsewhere (e.g. seed_data.py) are
+    picked up once the TTL runs out.
+    """
+
+    def __init__(self, ttl_seconds: int, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # token -> (expires_at, user)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[dict]:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[token]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return user
+
+    def put(self, token: str, user: dict, token_exp: float):
+        ttl = min(self.ttl_seconds, token_exp - time.time())
+        if ttl <= 0:
+            return
+        self._entries[token] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: str):
+        stale = [token for token, (_, user) in self._entries.items() if user['id'] == user_id]
+        for token in stale:
+            del self._entries[token]
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL_SECONDS, PRINCIPAL_CACHE_SIZE)
+
 def create_token(user_id: str, email: str) -> str:
     payload = {
         "sub": user_id,
@@ -140,11 +420,16 @@ def create_token(user_id: str, email: str) -> str:
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    token = credentials.credentials
+    user = principal_cache.get(token)
+    if user is not None:
+        return user
     try:
-        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
+        principal_cache.put(token, user, payload["exp"])
         return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -155,16 +440,19 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 @api_router.post("/auth/register", response_model=TokenResponse)
 async def register(user_data: UserCreate):
-    existing = await db.users.find_one({"email": user_data.email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
     user = User(email=user_data.email, name=user_data.name)
     user_dict = user.model_dump()
-    user_dict['password_hash'] = hash_password(user_data.password)
-    user_dict['created_at'] = user_dict['created_at'].isoformat()
+    user_dict['password_hash'] = await auth_pool.run(hash_password, user_data.password)
     
-    await db.users.insert_one(user_dict)
+    # The unique email index rejects duplicates, including concurrent registrations.
+    # Without it (e.g. existing duplicates blocked the build) check up front.
+    if ("users", "email_unique") in missing_unique_indexes:
+        if await db.users.find_one({"email": user.email}, {"_id": 1}):
+            raise HTTPException(status_code=400, detail="Email already registered")
+    try:
+        await db.users.insert_one(user_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     token = create_token(user.id, user.email)
     
     return TokenResponse(
@@ -175,7 +463,7 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user.get('password_hash', '')):
+    if not user or not await auth_pool.run(verify_password, credentials.password, user.get('password_hash', '')):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_token(user['id'], user['email'])
@@ -188,31 +476,235 @@ async def login(credentials: UserLogin):
 async def get_me(current_user: dict = Depends(get_current_user)):
     return {"id": current_user['id'], "email": current_user['email'], "name": current_user['name'], "role": current_user['role']}
 
+# ============ CONDITIONAL RESPONSES ============
+
+class ContentVersions:
+    """Write counters per collection, used to build ETags without reading data.
+
+    Every write route bumps the collections it touches. The random epoch makes
+    ETags from a previous process never match. Writes made elsewhere (another
+    worker, seed_data.py) are invisible to the counters, so ETags also roll
+    over every `max_age` seconds. View counts are not versioned, so a 304 may
+    carry a slightly older `views` figure.
+
+    ETags are weak: the same tag covers the identity, gzip and br encodings.
+    """
+
+    def __init__(self, max_age: int):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.max_age = max_age
+        self._versions = defaultdict(int)
+
+    def bump(self, *collections: str):
+        for collection in collections:
+            self._versions[collection] += 1
+
+    def get(self, collection: str) -> int:
+        return self._versions[collection]
+
+    def etag(self, collections: List[str], *parts) -> str:
+        period = int(time.time() // self.max_age)
+        key = "|".join([self.epoch, str(period), *(f"{c}:{self._versions[c]}" for c in collections), *map(str, parts)])
+        return 'W/"' + hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest() + '"'
+
+content_versions = ContentVersions(CONTENT_VERSION_MAX_AGE_SECONDS)
+
+def not_modified(request: Request, response: Response, etag: str, cache_control: str = "no-cache") -> Optional[Response]:
+    """Return a 304 if the client already holds `etag`, otherwise tag `response`.
+    If-None-Match uses weak comparison, so W/ prefixes are ignored."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        held = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag.removeprefix("W/") in held:
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return None
+
+# ============ JSON RESPONSES ============
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+class TrustedListResponse(Response):
+    """List of documents read from our own collections, encoded as-is.
+
+    List routes project exactly the fields their response model exposes, so
+    re-validating every document through response_model only burns CPU. With
+    orjson installed the documents go straight to bytes; without it they are
+    validated and encoded in one batch by the route's pydantic TypeAdapter.
+    """
+    media_type = "application/json"
+
+    def __init__(self, content: list, adapter: TypeAdapter, headers=None):
+        self.adapter = adapter
+        super().__init__(content, headers=headers)
+
+    def render(self, content: list) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+        return self.adapter.dump_json(self.adapter.validate_python(content), exclude_unset=True)
+
+def trusted_list(content: list, adapter: TypeAdapter, response: Optional[Response] = None):
+    """Return `content` via TrustedListResponse when FAST_JSON_RESPONSES is on,
+    keeping any headers already set on the route's `response`."""
+    if not FAST_JSON_RESPONSES:
+        return content
+    headers = dict(response.headers) if response is not None else None
+    return TrustedListResponse(content, adapter, headers=headers)
+
+ARTICLE_SUMMARY_LIST = TypeAdapter(List[ArticleSummary])
+SUBSCRIBER_LIST = TypeAdapter(List[Subscriber])
+
+# ============ COMPRESSION ============
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Pick br, gzip or identity from an Accept-Encoding header."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+class CompressedBody:
+    """One encoded JSON body plus its compressed variants, built on first use."""
+
+    def __init__(self, body: bytes):
+        self._variants = {"identity": body}
+
+    def get(self, encoding: str) -> bytes:
+        variant = self._variants.get(encoding)
+        if variant is None:
+            identity = self._variants["identity"]
+            if encoding == "br":
+                variant = brotli.compress(identity, quality=9)
+            else:
+                variant = gzip.compress(identity, compresslevel=9)
+            self._variants[encoding] = variant
+        return variant
+
+class CompressedResponseCache:
+    """LRU of CompressedBody keyed by ETag. ETags change with every write and
+    every CONTENT_VERSION_MAX_AGE_SECONDS, so each public response is encoded
+    and compressed at most once per edit or period; stale entries simply age
+    out. Cached bodies freeze `views` until the ETag changes."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, etag: str) -> Optional[CompressedBody]:
+        entry = self._entries.get(etag)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(etag)
+        self.hits += 1
+        return entry
+
+    def put(self, etag: str, entry: CompressedBody) -> CompressedBody:
+        self._entries[etag] = entry
+        self._entries.move_to_end(etag)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+compressed_cache = CompressedResponseCache(COMPRESSED_CACHE_SIZE)
+
+def encode_json(content) -> bytes:
+    """Encode like FastAPI does for routes without a response_model."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+async def precompressed_response(request: Request, response: Response, etag: str, load) -> Response:
+    """Serve the body for `etag` from compressed_cache, calling `load()` for
+    the content only on a miss, in the encoding the client prefers."""
+    entry = compressed_cache.get(etag)
+    if entry is None:
+        entry = compressed_cache.put(etag, CompressedBody(encode_json(await load())))
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    headers = {**response.headers, "Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(entry.get(encoding), media_type="application/json", headers=headers)
+
+# ============ CATEGORY TABLE ============
+
+class CategoryTable:
+    """Process-local copy of the categories collection, indexed by slug and id.
+
+    Loaded at startup and reloaded by every category write route, so reads
+    never go to Mongo.
+    """
+
+    def __init__(self):
+        self._categories = []
+        self._by_id = {}
+        self._by_slug = {}
+        self.loaded_at = None
+
+    async def reload(self):
+        categories = await db.categories.find({}, {"_id": 0}).to_list(None)
+        self._categories = categories
+        self._by_id = {cat['id']: cat for cat in categories}
+        self._by_slug = {cat['slug']: cat for cat in categories}
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def all(self) -> list:
+        return self._categories
+
+    def get_by_id(self, category_id: str) -> Optional[dict]:
+        return self._by_id.get(category_id)
+
+    def get_by_slug(self, slug: str) -> Optional[dict]:
+        return self._by_slug.get(slug)
+
+    def stats(self) -> dict:
+        return {"size": len(self._categories), "loaded_at": self.loaded_at}
+
+category_table = CategoryTable()
+
 # ============ CATEGORY ROUTES ============
 
 @api_router.get("/categories", response_model=List[Category])
-async def get_categories():
-    categories = await db.categories.find({}, {"_id": 0}).to_list(100)
-    for cat in categories:
-        if isinstance(cat.get('created_at'), str):
-            cat['created_at'] = datetime.fromisoformat(cat['created_at'])
-    return categories
+async def get_categories(request: Request, response: Response):
+    cached = not_modified(request, response, content_versions.etag(["categories"]))
+    if cached:
+        return cached
+    return category_table.all()
 
 @api_router.get("/categories/{slug}")
-async def get_category(slug: str):
-    category = await db.categories.find_one({"slug": slug}, {"_id": 0})
+async def get_category(slug: str, request: Request, response: Response):
+    cached = not_modified(request, response, content_versions.etag(["categories"], slug))
+    if cached:
+        return cached
+    category = category_table.get_by_slug(slug)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    if isinstance(category.get('created_at'), str):
-        category['created_at'] = datetime.fromisoformat(category['created_at'])
     return category
 
 @api_router.post("/categories", response_model=Category)
 async def create_category(category_data: CategoryBase, current_user: dict = Depends(get_current_user)):
     category = Category(**category_data.model_dump())
     cat_dict = category.model_dump()
-    cat_dict['created_at'] = cat_dict['created_at'].isoformat()
     await db.categories.insert_one(cat_dict)
+    content_versions.bump("categories")
+    await category_table.reload()
+    site_feeds.set_categories(category_table.all())
     return category
 
 @api_router.put("/categories/{category_id}", response_model=Category)
@@ -223,133 +715,547 @@ async def update_category(category_id: str, category_data: CategoryBase, current
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Category not found")
-    category = await db.categories.find_one({"id": category_id}, {"_id": 0})
-    return category
+    content_versions.bump("categories")
+    await category_table.reload()
+    site_feeds.set_categories(category_table.all())
+    return category_table.get_by_id(category_id)
 
 @api_router.delete("/categories/{category_id}")
 async def delete_category(category_id: str, current_user: dict = Depends(get_current_user)):
     result = await db.categories.delete_one({"id": category_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Category not found")
+    content_versions.bump("categories")
+    await category_table.reload()
+    site_feeds.set_categories(category_table.all())
     return {"message": "Category deleted"}
 
+# ============ COUNTERS ============
+
+# Single document in `counters` holding the dashboard totals. Every write path
+# that changes one of them applies a matching $inc, so reading the dashboard
+# is one find_one. reconcile_counters rebuilds it from the source collections.
+COUNTERS_ID = "dashboard"
+COUNTER_FIELDS = ["total_articles", "published_articles", "total_views", "total_subscribers"]
+
+async def bump_counters(**deltas: int):
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if deltas:
+        await db.counters.update_one({"_id": COUNTERS_ID}, {"$inc": deltas}, upsert=True)
+
+async def reconcile_counters() -> dict:
+    article_stats, subscriber_stats = await asyncio.gather(collect_article_stats(), collect_subscriber_stats())
+    counters = {**article_stats, "total_subscribers": subscriber_stats["total"]}
+    await db.counters.replace_one(
+        {"_id": COUNTERS_ID},
+        {**counters, "reconciled_at": datetime.now(timezone.utc)},
+        upsert=True,
+    )
+    return counters
+
+async def read_counters() -> dict:
+    counters = await db.counters.find_one({"_id": COUNTERS_ID}, {"_id": 0})
+    if counters is None:
+        return await reconcile_counters()
+    return {field: counters.get(field, 0) for field in COUNTER_FIELDS}
+
+# ============ VIEW COUNTER ============
+
+class ViewCounterBuffer:
+    """Accumulates article views in memory and writes them back in one
+    unordered bulk_write of $inc operations per flush."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._pending = {}  # article slug -> views not yet written
+        self._task = None
+        self.flushes = 0
+        self.flushed_views = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+
+    def record(self, slug: str):
+        self._pending[slug] = self._pending.get(slug, 0) + 1
+
+    def discard(self, slug: str):
+        """Forget buffered views for an article that no longer exists."""
+        self._pending.pop(slug, None)
+
+    async def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        started = time.perf_counter()
+        try:
+            result = await db.articles.bulk_write(
+                [UpdateOne({"slug": slug}, {"$inc": {"views": count}}) for slug, count in pending.items()],
+                ordered=False,
+            )
+        except Exception:
+            # Put the counts back so the next flush retries them
+            for slug, count in pending.items():
+                self._pending[slug] = self._pending.get(slug, 0) + count
+            self.failed_flushes += 1
+            logger.exception("Failed to flush %d article view counters", len(pending))
+            return
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        try:
+            if result.matched_count < len(pending):
+                # Some articles were deleted or renamed since the views were
+                # recorded; only the views that landed count towards the total
+                existing = await db.articles.find(
+                    {"slug": {"$in": list(pending)}}, {"_id": 0, "slug": 1}
+                ).to_list(None)
+                pending = {doc["slug"]: pending[doc["slug"]] for doc in existing}
+            self.flushed_views += sum(pending.values())
+            await bump_counters(total_views=sum(pending.values()))
+        except Exception:
+            # The views themselves are written; reconcile_counters repairs the total
+            logger.exception("Failed to add flushed views to counters")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.flush()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending_articles": len(self._pending),
+            "pending_views": sum(self._pending.values()),
+            "flushes": self.flushes,
+            "flushed_views": self.flushed_views,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+view_counter = ViewCounterBuffer(VIEW_FLUSH_INTERVAL_SECONDS)
+
+# ============ PAGINATION ============
+
+# Newest-first keyset order shared by every paginated article list
+ARTICLE_PAGE_SORT = [("created_at", DESCENDING), ("id", DESCENDING)]
+
+def encode_cursor(article: dict) -> str:
+    created_at = article['created_at']
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = json.dumps({"c": created_at, "i": article['id']}).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(cursor: str) -> dict:
+    """Turn a cursor into a filter matching everything after it in ARTICLE_PAGE_SORT order."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        created_at, article_id = datetime.fromisoformat(data["c"]), data["i"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$lt": article_id}},
+    ]}
+
+# Full article as returned to clients; search_text only exists for the text index
+ARTICLE_PROJECTION = {"_id": 0, "search_text": 0}
+
+def article_list_projection(include: Optional[str]) -> dict:
+    """Projection for list routes: drop `content` unless include=content."""
+    fields = {field.strip() for field in include.split(",")} if include else set()
+    if "content" in fields:
+        return ARTICLE_PROJECTION
+    return {**ARTICLE_PROJECTION, "content": 0}
+
+async def fetch_article_page(query: dict, response: Response, limit: int, cursor: Optional[str] = None, skip: int = 0, projection: Optional[dict] = None) -> list:
+    """Fetch one page of articles and put the cursor for the next one in the
+    X-Next-Cursor header (absent on the last page). `skip` is only honoured
+    when no cursor is given."""
+    if cursor:
+        query = {**query, **decode_cursor(cursor)}
+    find = db.articles.find(query, projection or ARTICLE_PROJECTION).sort(ARTICLE_PAGE_SORT)
+    if skip and not cursor:
+        find = find.skip(skip)
+    articles = await find.limit(limit + 1).to_list(limit + 1)
+    if len(articles) > limit:
+        articles = articles[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(articles[-1])
+    return articles
+
+# ============ SEARCH ============
+
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+SNIPPET_RADIUS = 80
+
+class SearchResult(ArticleSummary):
+    score: float
+    snippet: str
+
+def strip_html(content: str) -> str:
+    """Plain text of an article body, stored as `search_text` for the text index."""
+    return WHITESPACE_RE.sub(" ", html.unescape(TAG_RE.sub(" ", content or ""))).strip()
+
+def build_snippet(text: str, terms: List[str]) -> str:
+    """Window of `text` around the first matching term, HTML-escaped, with
+    every term (and its inflections, to mirror stemming) wrapped in <mark>."""
+    if not terms:
+        return html.escape(text[:2 * SNIPPET_RADIUS])
+    term_re = re.compile(r"\b(?:" + "|".join(map(re.escape, terms)) + r")\w*", re.IGNORECASE)
+    match = term_re.search(text)
+    center = match.start() if match else 0
+    start = max(0, center - SNIPPET_RADIUS)
+    end = min(len(text), center + SNIPPET_RADIUS)
+    window = text[start:end]
+    parts = []
+    last = 0
+    for hit in term_re.finditer(window):
+        parts.append(html.escape(window[last:hit.start()]))
+        parts.append(f"<mark>{html.escape(hit.group(0))}</mark>")
+        last = hit.end()
+    parts.append(html.escape(window[last:]))
+    return ("…" if start else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+async def backfill_search_text(batch_size: int = 500) -> int:
+    """Populate search_text on articles written before it existed."""
+    updated = 0
+    while True:
+        docs = await db.articles.find(
+            {"search_text": {"$exists": False}}, {"_id": 1, "content": 1}
+        ).limit(batch_size).to_list(batch_size)
+        if not docs:
+            return updated
+        await db.articles.bulk_write(
+            [UpdateOne({"_id": doc["_id"]}, {"$set": {"search_text": strip_html(doc.get("content", ""))}}) for doc in docs],
+            ordered=False,
+        )
+        updated += len(docs)
+
+# ============ RELATED ARTICLES ============
+
+class RelatedArticle(ArticleSummary):
+    score: float
+
+related_index = RelatedArticlesIndex()
+
+async def rebuild_related_index():
+    """Rebuild the related-articles table off the event loop. If an article is
+    written while the build runs, the result is stale and the build repeats."""
+    global related_index
+    while True:
+        version = content_versions.get("articles")
+        articles = await db.articles.find({"is_published": True}, {"_id": 0, "content": 0}).to_list(None)
+        index = await asyncio.to_thread(RelatedArticlesIndex.build, articles)
+        if content_versions.get("articles") == version:
+            related_index = index
+            return
+
+# ============ SITEMAP & FEED ============
+
+site_feeds = SiteFeeds(
+    SITE_URL,
+    title="RestfulMind",
+    description="Articles on sleep, mental health and productivity",
+)
+
+async def reload_site_feeds():
+    """Reload the feeds from Mongo. As in rebuild_related_index, a write that
+    lands while the query runs would be lost by load(), so the read repeats."""
+    while True:
+        version = content_versions.get("articles")
+        articles = await db.articles.find(
+            {"is_published": True},
+            {"_id": 0, "id": 1, "slug": 1, "title": 1, "excerpt": 1, "is_published": 1, "created_at": 1, "updated_at": 1}
+        ).to_list(None)
+        if content_versions.get("articles") == version:
+            site_feeds.load(articles, category_table.all())
+            return
+
+def refresh_article_indexes(article: dict):
+    """Keep the related-articles table and site feeds in step with one article write."""
+    if article.get('is_published'):
+        related_index.upsert(article)
+    else:
+        related_index.remove(article['id'])
+    site_feeds.upsert_article(article)
+
+def drop_article_indexes(article_id: str):
+    related_index.remove(article_id)
+    site_feeds.remove_article(article_id)
+
+@api_router.get("/sitemap.xml")
+async def get_sitemap():
+    if site_feeds.sitemap_chunks() == 1:
+        return StreamingResponse(site_feeds.iter_sitemap(0), media_type="application/xml")
+    # Chunk links are SITE_URL/api/sitemap-N.xml, served by get_sitemap_chunk
+    return Response(site_feeds.sitemap_index(), media_type="application/xml")
+
+@api_router.get("/sitemap-{chunk}.xml")
+async def get_sitemap_chunk(chunk: int):
+    if not 1 <= chunk <= site_feeds.sitemap_chunks():
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return StreamingResponse(site_feeds.iter_sitemap(chunk - 1), media_type="application/xml")
+
+@api_router.get("/feed.xml")
+async def get_feed():
+    return Response(site_feeds.feed(), media_type="application/rss+xml")
+
+# ============ WEEKLY FEED ============
+
+WEEKLY_WINDOW = timedelta(days=7)
+WEEKLY_FEED_LIMIT = 50
+
+class WeeklyFeed:
+    """Materialized /articles/weekly-updates result.
+
+    Articles only enter the 7-day window through a write, which bumps the
+    articles version and forces a recompute on the next request. They leave
+    it as time passes, so the result also expires when its oldest article
+    ages out, or after WEEKLY_FEED_MAX_AGE_SECONDS to pick up writes made by
+    other processes, whichever comes first.
+    """
+
+    def __init__(self, max_age: timedelta):
+        self.max_age = max_age
+        self._articles = []
+        self._version = None
+        self._expires_at = None
+        self._lock = asyncio.Lock()
+        self.generation = 0
+
+    def _fresh(self, now: datetime) -> bool:
+        return self._version == content_versions.get("articles") and now < self._expires_at
+
+    async def get(self) -> list:
+        if self._version is not None and self._fresh(datetime.now(timezone.utc)):
+            return self._articles
+        async with self._lock:
+            now = datetime.now(timezone.utc)
+            if self._version is None or not self._fresh(now):
+                await self._refresh(now)
+        return self._articles
+
+    async def _refresh(self, now: datetime):
+        version = content_versions.get("articles")
+        articles = await db.articles.find(
+            {"is_published": True, "updated_at": {"$gte": now - WEEKLY_WINDOW}},
+            article_list_projection(None)
+        ).sort("updated_at", -1).to_list(WEEKLY_FEED_LIMIT)
+        expires_at = now + self.max_age
+        updated = [art['updated_at'] for art in articles if isinstance(art.get('updated_at'), datetime)]
+        if updated:
+            expires_at = min(expires_at, min(updated) + WEEKLY_WINDOW)
+        self._articles = articles
+        self._version = version
+        self._expires_at = expires_at
+        self.generation += 1
+
+    def stats(self) -> dict:
+        return {"articles": len(self._articles), "generation": self.generation, "expires_at": self._expires_at}
+
+weekly_feed = WeeklyFeed(timedelta(seconds=WEEKLY_FEED_MAX_AGE_SECONDS))
+
 # ============ ARTICLE ROUTES ============
 
-@api_router.get("/articles", response_model=List[Article])
+@api_router.get("/articles", response_model=List[ArticleSummary], response_model_exclude_unset=True)
 async def get_articles(
+    request: Request,
+    response: Response,
     category: Optional[str] = None,
     featured: Optional[bool] = None,
-    limit: int = 50,
-    skip: int = 0
+    limit: int = Query(50, ge=1, le=200),
+    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    include: Optional[str] = None
 ):
+    etag = content_versions.etag(["articles", "categories"], sorted(request.query_params.multi_items()))
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
     query = {"is_published": True}
     if category:
-        cat = await db.categories.find_one({"slug": category}, {"_id": 0})
+        cat = category_table.get_by_slug(category)
         if cat:
             query["category_id"] = cat['id']
     if featured is not None:
         query["is_featured"] = featured
     
-    articles = await db.articles.find(query, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
-    for art in articles:
-        if isinstance(art.get('created_at'), str):
-            art['created_at'] = datetime.fromisoformat(art['created_at'])
-        if isinstance(art.get('updated_at'), str):
-            art['updated_at'] = datetime.fromisoformat(art['updated_at'])
-    return articles
-
-@api_router.get("/articles/weekly-updates", response_model=List[Article])
-async def get_weekly_updates():
-    one_week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+    articles = await fetch_article_page(query, response, limit, cursor, skip, article_list_projection(include))
+    return trusted_list(articles, ARTICLE_SUMMARY_LIST, response)
+
+@api_router.get("/articles/weekly-updates", response_model=List[ArticleSummary], response_model_exclude_unset=True)
+async def get_weekly_updates(request: Request, response: Response, include: Optional[str] = None):
+    if include:
+        # Full bodies are rarely asked for, so only the summary feed is materialized
+        one_week_ago = datetime.now(timezone.utc) - WEEKLY_WINDOW
+        return await db.articles.find(
+            {"is_published": True, "updated_at": {"$gte": one_week_ago}},
+            article_list_projection(include)
+        ).sort("updated_at", -1).to_list(WEEKLY_FEED_LIMIT)
+    
+    articles = await weekly_feed.get()
+    cached = not_modified(request, response, content_versions.etag(["articles"], "weekly", weekly_feed.generation))
+    if cached:
+        return cached
+    return trusted_list(articles, ARTICLE_SUMMARY_LIST, response)
+
+@api_router.get("/articles/search", response_model=List[SearchResult], response_model_exclude_unset=True)
+async def search_articles(
+    q: str = Query(..., min_length=1, max_length=200),
+    category: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    query = {"$text": {"$search": q}, "is_published": True}
+    if category:
+        cat = category_table.get_by_slug(category)
+        if not cat:
+            return []
+        query["category_id"] = cat['id']
+    
+    score = {"$meta": "textScore"}
     articles = await db.articles.find(
-        {"is_published": True, "updated_at": {"$gte": one_week_ago}},
-        {"_id": 0}
-    ).sort("updated_at", -1).to_list(50)
+        query, {"_id": 0, "content": 0, "score": score}
+    ).sort([("score", score)]).limit(limit).to_list(limit)
+    terms = [term.strip('"-') for term in q.split() if term.strip('"-')]
     for art in articles:
-        if isinstance(art.get('created_at'), str):
-            art['created_at'] = datetime.fromisoformat(art['created_at'])
-        if isinstance(art.get('updated_at'), str):
-            art['updated_at'] = datetime.fromisoformat(art['updated_at'])
+        art['snippet'] = build_snippet(art.pop('search_text', '') or art['excerpt'], terms)
     return articles
 
-@api_router.get("/articles/all", response_model=List[Article])
-async def get_all_articles(current_user: dict = Depends(get_current_user)):
-    articles = await db.articles.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    for art in articles:
-        if isinstance(art.get('created_at'), str):
-            art['created_at'] = datetime.fromisoformat(art['created_at'])
-        if isinstance(art.get('updated_at'), str):
-            art['updated_at'] = datetime.fromisoformat(art['updated_at'])
-    return articles
+@api_router.get("/articles/all", response_model=List[ArticleSummary], response_model_exclude_unset=True)
+async def get_all_articles(
+    response: Response,
+    limit: int = Query(1000, ge=1, le=5000),
+    cursor: Optional[str] = None,
+    include: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    articles = await fetch_article_page({}, response, limit, cursor, projection=article_list_projection(include))
+    return trusted_list(articles, ARTICLE_SUMMARY_LIST, response)
+
+@api_router.get("/articles/{slug}/related", response_model=List[RelatedArticle], response_model_exclude_unset=True)
+async def get_related_articles(slug: str):
+    return [{**summary, "score": score} for summary, score in related_index.related(slug)]
 
 @api_router.get("/articles/{slug}")
-async def get_article(slug: str):
-    article = await db.articles.find_one({"slug": slug}, {"_id": 0})
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    
-    # Increment views
-    await db.articles.update_one({"slug": slug}, {"$inc": {"views": 1}})
-    
-    if isinstance(article.get('created_at'), str):
-        article['created_at'] = datetime.fromisoformat(article['created_at'])
-    if isinstance(article.get('updated_at'), str):
-        article['updated_at'] = datetime.fromisoformat(article['updated_at'])
+async def get_article(slug: str, request: Request, response: Response):
+    etag = content_versions.etag(["articles", "categories"], slug)
+    cached = not_modified(request, response, etag)
+    if cached:
+        # The ETag only matches while the article exists, so the view still counts
+        view_counter.record(slug)
+        return cached
+
+    async def load_article():
+        article = await db.articles.find_one({"slug": slug}, ARTICLE_PROJECTION)
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        
+        # Get category info
+        article['category'] = category_table.get_by_id(article['category_id'])
+        return article
+
+    result = await precompressed_response(request, response, etag, load_article)
     
-    # Get category info
-    category = await db.categories.find_one({"id": article['category_id']}, {"_id": 0})
-    article['category'] = category
+    # Increment views (written back in batches by view_counter)
+    view_counter.record(slug)
     
-    return article
+    return result
 
 @api_router.post("/articles", response_model=Article)
 async def create_article(article_data: ArticleCreate, current_user: dict = Depends(get_current_user)):
     article = Article(**article_data.model_dump())
     art_dict = article.model_dump()
-    art_dict['created_at'] = art_dict['created_at'].isoformat()
-    art_dict['updated_at'] = art_dict['updated_at'].isoformat()
+    art_dict['search_text'] = strip_html(article.content)
     await db.articles.insert_one(art_dict)
+    content_versions.bump("articles")
+    refresh_article_indexes(art_dict)
+    await bump_counters(total_articles=1, published_articles=int(article.is_published))
     return article
 
 @api_router.put("/articles/{article_id}", response_model=Article)
 async def update_article(article_id: str, article_data: ArticleUpdate, current_user: dict = Depends(get_current_user)):
     update_dict = {k: v for k, v in article_data.model_dump().items() if v is not None}
-    update_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
+    update_dict['updated_at'] = datetime.now(timezone.utc)
+    if 'content' in update_dict:
+        update_dict['search_text'] = strip_html(update_dict['content'])
     
-    result = await db.articles.update_one(
+    previous = await db.articles.find_one_and_update(
         {"id": article_id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        projection={"_id": 0, "is_published": 1},
+        return_document=ReturnDocument.BEFORE
     )
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Article not found")
+    content_versions.bump("articles")
+    if 'is_published' in update_dict:
+        await bump_counters(published_articles=int(update_dict['is_published']) - int(previous.get('is_published', False)))
     
     article = await db.articles.find_one({"id": article_id}, {"_id": 0})
-    if isinstance(article.get('created_at'), str):
-        article['created_at'] = datetime.fromisoformat(article['created_at'])
-    if isinstance(article.get('updated_at'), str):
-        article['updated_at'] = datetime.fromisoformat(article['updated_at'])
+    refresh_article_indexes(article)
     return article
 
 @api_router.delete("/articles/{article_id}")
 async def delete_article(article_id: str, current_user: dict = Depends(get_current_user)):
-    result = await db.articles.delete_one({"id": article_id})
-    if result.deleted_count == 0:
+    deleted = await db.articles.find_one_and_delete(
+        {"id": article_id},
+        projection={"_id": 0, "slug": 1, "is_published": 1, "views": 1}
+    )
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Article not found")
+    content_versions.bump("articles")
+    drop_article_indexes(article_id)
+    view_counter.discard(deleted['slug'])
+    await bump_counters(
+        total_articles=-1,
+        published_articles=-int(deleted.get('is_published', False)),
+        total_views=-deleted.get('views', 0)
+    )
     return {"message": "Article deleted"}
 
 # ============ SUBSCRIBER ROUTES ============
 
 @api_router.post("/subscribers", response_model=Subscriber)
 async def create_subscriber(subscriber_data: SubscriberCreate):
-    existing = await db.subscribers.find_one({"email": subscriber_data.email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already subscribed")
-    
     subscriber = Subscriber(**subscriber_data.model_dump())
-    sub_dict = subscriber.model_dump()
-    sub_dict['subscribed_at'] = sub_dict['subscribed_at'].isoformat()
-    await db.subscribers.insert_one(sub_dict)
-    return subscriber
+    
+    # One atomic upsert: inserts a new address, reactivates an unsubscribed one,
+    # and fails on the unique email index when the address is already active.
+    # Without that index the upsert would insert a second document, so check first.
+    if ("subscribers", "email_unique") in missing_unique_indexes:
+        if await db.subscribers.find_one({"email": subscriber.email, "is_active": True}, {"_id": 1}):
+            raise HTTPException(status_code=400, detail="Email already subscribed")
+    try:
+        sub_dict = await db.subscribers.find_one_and_update(
+            {"email": subscriber.email, "is_active": {"$ne": True}},
+            {
+                "$set": {
+                    "interests": subscriber.interests,
+                    "gdpr_consent": subscriber.gdpr_consent,
+                    "subscribed_at": subscriber.subscribed_at,
+                    "is_active": True
+                },
+                "$setOnInsert": {"id": subscriber.id}
+            },
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already subscribed")
+    await bump_counters(total_subscribers=1)
+    return sub_dict
 
 @api_router.get("/subscribers", response_model=List[Subscriber])
 async def get_subscribers(
@@ -361,81 +1267,400 @@ async def get_subscribers(
         query["interests"] = interest
     
     subscribers = await db.subscribers.find(query, {"_id": 0}).to_list(1000)
-    for sub in subscribers:
-        if isinstance(sub.get('subscribed_at'), str):
-            sub['subscribed_at'] = datetime.fromisoformat(sub['subscribed_at'])
-    return subscribers
+    return trusted_list(subscribers, SUBSCRIBER_LIST)
+
+SUBSCRIBER_EXPORT_FIELDS = ["id", "email", "interests", "gdpr_consent", "subscribed_at", "is_active"]
+EXPORT_BATCH_SIZE = 1000
+
+async def stream_subscribers(query: dict, export_format: str):
+    """Yield the export straight off the Motor cursor, one batch of rows per chunk."""
+    projection = {"_id": 0, **{field: 1 for field in SUBSCRIBER_EXPORT_FIELDS}}
+    cursor = db.subscribers.find(query, projection).sort("id", 1).batch_size(EXPORT_BATCH_SIZE)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == "csv":
+        writer.writerow(SUBSCRIBER_EXPORT_FIELDS)
+    rows = 0
+    async for sub in cursor:
+        if export_format == "csv":
+            subscribed_at = sub.get('subscribed_at')
+            writer.writerow([
+                sub.get('id', ''),
+                sub.get('email', ''),
+                ";".join(sub.get('interests', [])),
+                sub.get('gdpr_consent', ''),
+                subscribed_at.isoformat() if isinstance(subscribed_at, datetime) else subscribed_at or '',
+                sub.get('is_active', ''),
+            ])
+        else:
+            buffer.write(json.dumps(sub, default=json_default))
+            buffer.write("\n")
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+@api_router.get("/subscribers/export")
+async def export_subscribers(
+    format: str = "csv",
+    interest: Optional[str] = None,
+    is_active: bool = True,
+    include_inactive: bool = False,
+    current_user: dict = Depends(get_current_user)
+):
+    # Active subscribers only unless the caller explicitly asks for everyone,
+    # so unsubscribed addresses never end up in a mailing tool by accident
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    query = {}
+    if not include_inactive:
+        query["is_active"] = is_active
+    if interest:
+        query["interests"] = interest
+    
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_subscribers(query, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="subscribers.{format}"'}
+    )
+
+IMPORT_BATCH_SIZE = 1000
+DUPLICATE_KEY_ERROR = 11000
+
+async def iter_body_lines(request: Request):
+    """Yield the request body line by line without buffering all of it."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ""
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+def parse_import_row(data: dict) -> SubscriberCreate:
+    interests = data.get("interests") or []
+    if isinstance(interests, str):
+        interests = [interest.strip() for interest in interests.split(";") if interest.strip()]
+    consent = data.get("gdpr_consent", True)
+    if isinstance(consent, str):
+        consent = consent.strip().lower() in ("true", "1", "yes", "y")
+    email = data.get("email") or ""
+    if isinstance(email, str):
+        email = email.strip()
+    # Anything else (numbers, lists) is left for validation to reject per row
+    return SubscriberCreate(email=email, interests=interests, gdpr_consent=consent)
+
+async def drop_existing_emails(batch: list, summary: dict) -> list:
+    """Fallback duplicate check for when the unique email index is missing."""
+    emails = [doc['email'] for _, doc in batch]
+    seen = {doc['email'] async for doc in db.subscribers.find({"email": {"$in": emails}}, {"_id": 0, "email": 1})}
+    kept = []
+    for row, doc in batch:
+        if doc['email'] in seen:
+            summary["duplicates"] += 1
+            summary["errors"].append({"row": row, "email": doc['email'], "error": "Email already subscribed"})
+            continue
+        seen.add(doc['email'])
+        kept.append((row, doc))
+    return kept
+
+async def insert_import_batch(batch: list, summary: dict):
+    """Insert one batch unordered and let the unique email index reject duplicates."""
+    if ("subscribers", "email_unique") in missing_unique_indexes:
+        batch = await drop_existing_emails(batch, summary)
+        if not batch:
+            return
+    docs = [doc for _, doc in batch]
+    try:
+        result = await db.subscribers.insert_many(docs, ordered=False)
+        inserted = len(result.inserted_ids)
+    except BulkWriteError as e:
+        inserted = e.details['nInserted']
+        for error in e.details['writeErrors']:
+            row, doc = batch[error['index']]
+            if error['code'] == DUPLICATE_KEY_ERROR:
+                summary["duplicates"] += 1
+                reason = "Email already subscribed"
+            else:
+                summary["failed"] += 1
+                reason = error['errmsg']
+            summary["errors"].append({"row": row, "email": doc['email'], "error": reason})
+    summary["inserted"] += inserted
+    await bump_counters(total_subscribers=inserted)
+
+@api_router.post("/subscribers/import")
+async def import_subscribers(
+    request: Request,
+    format: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Bulk import subscribers from a CSV (with an email,interests,gdpr_consent
+    header; interests separated by ';') or NDJSON request body."""
+    if format is None:
+        format = "ndjson" if "json" in request.headers.get("content-type", "") else "csv"
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    
+    summary = {"received": 0, "inserted": 0, "duplicates": 0, "invalid": 0, "failed": 0, "errors": []}
+    header = None
+    batch = []
+    async for line in iter_body_lines(request):
+        if not line.strip():
+            continue
+        if format == "csv" and header is None:
+            header = [column.strip().lower() for column in next(csv.reader([line]))]
+            if "email" not in header:
+                raise HTTPException(status_code=400, detail="CSV header must include an email column")
+            continue
+        summary["received"] += 1
+        row = summary["received"]
+        try:
+            data = json.loads(line) if format == "ndjson" else dict(zip(header, next(csv.reader([line]))))
+            if not isinstance(data, dict):
+                raise ValueError("Row must be an object")
+            subscriber = Subscriber(**parse_import_row(data).model_dump())
+        except ValidationError as e:
+            error = e.errors()[0]
+            summary["invalid"] += 1
+            summary["errors"].append({"row": row, "error": f"{'.'.join(map(str, error['loc']))}: {error['msg']}"})
+            continue
+        except ValueError as e:
+            summary["invalid"] += 1
+            summary["errors"].append({"row": row, "error": str(e)})
+            continue
+        batch.append((row, subscriber.model_dump()))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await insert_import_batch(batch, summary)
+            batch = []
+    if batch:
+        await insert_import_batch(batch, summary)
+    return summary
 
 @api_router.get("/subscribers/stats")
 async def get_subscriber_stats(current_user: dict = Depends(get_current_user)):
-    total = await db.subscribers.count_documents({"is_active": True})
-    
-    # Get counts by interest
-    pipeline = [
-        {"$match": {"is_active": True}},
-        {"$unwind": "$interests"},
-        {"$group": {"_id": "$interests", "count": {"$sum": 1}}}
-    ]
-    interest_stats = await db.subscribers.aggregate(pipeline).to_list(100)
-    
-    return {
-        "total": total,
-        "by_interest": {stat['_id']: stat['count'] for stat in interest_stats}
-    }
+    timings = {}
+    subscriber_stats = await timed_query("subscribers", collect_subscriber_stats(), timings)
+    return {**subscriber_stats, "timings_ms": timings}
 
 @api_router.delete("/subscribers/{subscriber_id}")
 async def unsubscribe(subscriber_id: str, current_user: dict = Depends(get_current_user)):
-    result = await db.subscribers.update_one(
+    previous = await db.subscribers.find_one_and_update(
         {"id": subscriber_id},
-        {"$set": {"is_active": False}}
+        {"$set": {"is_active": False}},
+        projection={"_id": 0, "is_active": 1},
+        return_document=ReturnDocument.BEFORE
     )
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Subscriber not found")
+    if previous.get('is_active'):
+        await bump_counters(total_subscribers=-1)
     return {"message": "Unsubscribed successfully"}
 
 # ============ STATIC CONTENT ROUTES ============
 
-@api_router.get("/content/{page_type}")
-async def get_static_content(page_type: str):
-    content = await db.static_content.find_one({"type": page_type}, {"_id": 0})
-    if not content:
-        # Return default content
-        defaults = {
-            "privacy": {
-                "type": "privacy",
-                "title": "Privacy Policy",
-                "content": get_default_privacy_policy()
-            },
-            "terms": {
-                "type": "terms",
-                "title": "Terms of Service",
-                "content": get_default_terms()
-            },
-            "disclaimer": {
-                "type": "disclaimer",
-                "title": "Disclaimer",
-                "content": get_default_disclaimer()
-            }
+class StaticContentUpdate(BaseModel):
+    title: str
+    content: str
+
+INLINE_MARKDOWN = [
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"\*(.+?)\*"), r"<em>\1</em>"),
+]
+
+def render_markdown(text: str) -> str:
+    """Render the small Markdown subset the legal pages use (##/### headings,
+    `-` lists, **bold**, *italic*, paragraphs) to HTML."""
+    blocks = []
+    paragraph = []
+    items = []
+
+    def inline(line):
+        line = html.escape(line)
+        for pattern, replacement in INLINE_MARKDOWN:
+            line = pattern.sub(replacement, line)
+        return line
+
+    def close_blocks():
+        if paragraph:
+            blocks.append("<p>" + " ".join(paragraph) + "</p>")
+            paragraph.clear()
+        if items:
+            blocks.append("<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>")
+            items.clear()
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            close_blocks()
+        elif line.startswith("### ") or line.startswith("## "):
+            close_blocks()
+            level = 3 if line.startswith("### ") else 2
+            blocks.append(f"<h{level}>{inline(line[level + 1:])}</h{level}>")
+        elif line.startswith("- "):
+            if paragraph:
+                close_blocks()
+            items.append(inline(line[2:]))
+        else:
+            if items:
+                close_blocks()
+            paragraph.append(inline(line))
+    close_blocks()
+    return "\n".join(blocks)
+
+class StaticContentSnapshot:
+    """Every static page, defaults included, held in memory with its
+    pre-rendered HTML. Reloaded only when an admin edits a page."""
+
+    def __init__(self):
+        self._pages = {}
+
+    async def reload(self):
+        pages = {
+            "privacy": {"type": "privacy", "title": "Privacy Policy", "content": get_default_privacy_policy()},
+            "terms": {"type": "terms", "title": "Terms of Service", "content": get_default_terms()},
+            "disclaimer": {"type": "disclaimer", "title": "Disclaimer", "content": get_default_disclaimer()},
         }
-        return defaults.get(page_type, {"type": page_type, "title": page_type.title(), "content": ""})
-    return content
+        for page in await db.static_content.find({}, {"_id": 0}).to_list(None):
+            pages[page['type']] = page
+        for page in pages.values():
+            page['content_html'] = render_markdown(page.get('content') or "")
+        self._pages = pages
+
+    def get(self, page_type: str) -> Optional[dict]:
+        return self._pages.get(page_type)
+
+    @staticmethod
+    def placeholder(page_type: str) -> dict:
+        """The empty page served for a type nobody has written yet."""
+        return {"type": page_type, "title": page_type.title(), "content": "", "content_html": ""}
+
+    def stats(self) -> dict:
+        return {"pages": len(self._pages)}
+
+static_content = StaticContentSnapshot()
+
+@api_router.get("/content/{page_type}")
+async def get_static_content(page_type: str, request: Request, response: Response):
+    if static_content.get(page_type) is None:
+        # Not cached or tagged: arbitrary page types must not evict real
+        # bodies from compressed_cache
+        return static_content.placeholder(page_type)
+    etag = content_versions.etag(["static_content"], page_type)
+    cache_control = f"public, max-age={STATIC_CONTENT_MAX_AGE}"
+    cached = not_modified(request, response, etag, cache_control)
+    if cached:
+        return cached
+
+    async def load_page():
+        return static_content.get(page_type)
+
+    return await precompressed_response(request, response, etag, load_page)
+
+@api_router.put("/content/{page_type}")
+async def update_static_content(page_type: str, content_data: StaticContentUpdate, current_user: dict = Depends(get_current_user)):
+    await db.static_content.update_one(
+        {"type": page_type},
+        {"$set": {**content_data.model_dump(), "updated_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    content_versions.bump("static_content")
+    await static_content.reload()
+    return static_content.get(page_type)
 
 # ============ STATS ROUTES ============
 
+# One $facet aggregation per collection, so each collection costs a single
+# round trip. Used by /subscribers/stats and to rebuild the counters document.
+ARTICLE_STATS_PIPELINE = [
+    {"$facet": {
+        "total": [{"$count": "n"}],
+        "published": [{"$match": {"is_published": True}}, {"$count": "n"}],
+        "views": [{"$group": {"_id": None, "n": {"$sum": "$views"}}}],
+    }}
+]
+
+SUBSCRIBER_STATS_PIPELINE = [
+    {"$match": {"is_active": True}},
+    {"$facet": {
+        "total": [{"$count": "n"}],
+        "by_interest": [{"$unwind": "$interests"}, {"$group": {"_id": "$interests", "count": {"$sum": 1}}}],
+    }}
+]
+
+def facet_value(facet: dict, key: str) -> int:
+    return facet[key][0]['n'] if facet[key] else 0
+
+async def collect_article_stats() -> dict:
+    facet = (await db.articles.aggregate(ARTICLE_STATS_PIPELINE).to_list(1))[0]
+    return {
+        "total_articles": facet_value(facet, "total"),
+        "published_articles": facet_value(facet, "published"),
+        "total_views": facet_value(facet, "views"),
+    }
+
+async def collect_subscriber_stats() -> dict:
+    facet = (await db.subscribers.aggregate(SUBSCRIBER_STATS_PIPELINE).to_list(1))[0]
+    return {
+        "total": facet_value(facet, "total"),
+        "by_interest": {stat['_id']: stat['count'] for stat in facet["by_interest"]},
+    }
+
+async def timed_query(name: str, coro, timings: dict):
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
 @api_router.get("/stats/dashboard")
 async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
-    total_articles = await db.articles.count_documents({})
-    published_articles = await db.articles.count_documents({"is_published": True})
-    total_subscribers = await db.subscribers.count_documents({"is_active": True})
-    total_views = await db.articles.aggregate([{"$group": {"_id": None, "total": {"$sum": "$views"}}}]).to_list(1)
-    
+    timings = {}
+    counters = await timed_query("counters", read_counters(), timings)
+    return {**counters, "timings_ms": timings}
+
+@api_router.post("/stats/reconcile")
+async def reconcile_dashboard_stats(current_user: dict = Depends(get_current_user)):
+    timings = {}
+    counters = await timed_query("reconcile", reconcile_counters(), timings)
+    return {**counters, "timings_ms": timings}
+
+@api_router.get("/stats/indexes")
+async def get_index_stats(current_user: dict = Depends(get_current_user)):
+    return await get_index_report()
+
+@api_router.get("/stats/auth-pool")
+async def get_auth_pool_stats(current_user: dict = Depends(get_current_user)):
+    return auth_pool.stats()
+
+@api_router.get("/stats/slow-queries")
+async def get_slow_query_stats(current_user: dict = Depends(get_current_user)):
+    return slow_query_log.stats()
+
+@api_router.get("/stats/caches")
+async def get_cache_stats(current_user: dict = Depends(get_current_user)):
     return {
-        "total_articles": total_articles,
-        "published_articles": published_articles,
-        "total_subscribers": total_subscribers,
-        "total_views": total_views[0]['total'] if total_views else 0
+        "principals": principal_cache.stats(),
+        "views": view_counter.stats(),
+        "categories": category_table.stats(),
+        "related_articles": related_index.stats(),
+        "compressed_responses": compressed_cache.stats(),
+        "static_content": static_content.stats(),
+        "weekly_feed": weekly_feed.stats(),
+        "site_feeds": site_feeds.stats(),
     }
 
+# Prometheus scrape target, kept outside the /api prefix
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
 # ============ HEALTH CHECK ============
 
 @api_router.get("/")
@@ -560,8 +1785,16 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# Everything not served from compressed_cache is compressed per response;
+# precompressed bodies already carry Content-Encoding and pass straight through
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
+
+# Outermost, so latency covers compression and CORS as well as the handler
+app.add_middleware(RequestMetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -569,6 +1802,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+background_migrations = None
+
+async def run_background_migrations():
+    """Each step is logged and skipped on failure, so a migration error never
+    leaves the related-articles table and site feeds empty until restart."""
+    try:
+        await backfill_search_text()
+    except Exception:
+        logger.exception("search_text backfill failed")
+    try:
+        totals = await migrate_timestamps(db)
+        content_versions.bump(*(name for name, count in totals.items() if count))
+        if totals.get("categories"):
+            await category_table.reload()
+    except Exception:
+        logger.exception("Timestamp migration failed")
+    for build in (rebuild_related_index, reload_site_feeds):
+        try:
+            await build()
+        except Exception:
+            logger.exception("%s failed", build.__name__)
+
+@app.on_event("startup")
+async def startup_db_client():
+    global background_migrations
+    view_counter.start()
+    slow_query_log.start(db)
+    await ensure_indexes()
+    if missing_unique_indexes:
+        logger.warning(
+            "Unique indexes missing (%s); duplicate checks fall back to a lookup that "
+            "concurrent requests can race past. Remove the duplicates and restart.",
+            ", ".join(f"{collection}.{name}" for collection, name in sorted(missing_unique_indexes)),
+        )
+    await category_table.reload()
+    await static_content.reload()
+    if await db.counters.find_one({"_id": COUNTERS_ID}) is None:
+        await reconcile_counters()
+    # Backfills search_text, converts legacy ISO-string timestamps and builds
+    # the related-articles table and site feeds in the background. Safe to
+    # interrupt: the migrations only pick up documents that still need them.
+    background_migrations = asyncio.create_task(run_background_migrations())
+    try:
+        report = await get_index_report()
+    except OperationFailure as e:
+        logger.warning("Could not build the index report: %s", e)
+        report = {}
+    for collection, entry in report.items():
+        if entry["missing"]:
+            logger.warning("Missing indexes on %s: %s", collection, ", ".join(entry["missing"]))
+        if entry["undeclared"]:
+            logger.warning("Undeclared indexes on %s: %s", collection, ", ".join(entry["undeclared"]))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    auth_pool.shutdown()
+    if background_migrations and not background_migrations.done():
+        background_migrations.cancel()
+    await view_counter.stop()
+    await slow_query_log.stop()
     client.close()
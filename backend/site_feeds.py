@@ -0,0 +1,162 @@
+"""
+sitemap.xml and RSS feed kept as prebuilt XML fragments.
+
+Every published article, category and static page is rendered to its
+`<url>` (and, for articles, `<item>`) fragment once, when it is written.
+Serving a sitemap is then a join of ready-made bytes, and a single article
+write only re-renders that article's fragments. Sitemaps past
+MAX_SITEMAP_URLS entries are split into numbered chunks behind a sitemap
+index, as the sitemap protocol requires, and are streamed out in batches.
+"""
+
+import heapq
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+MAX_SITEMAP_URLS = 50000
+FEED_SIZE = 20
+STREAM_BATCH = 1000
+
+STATIC_PAGES = [
+    ("/", "daily", "1.0"),
+    ("/weekly-updates", "daily", "0.8"),
+    ("/privacy", "yearly", "0.2"),
+    ("/terms", "yearly", "0.2"),
+    ("/disclaimer", "yearly", "0.2"),
+    ("/contact", "yearly", "0.2"),
+]
+
+URLSET_OPEN = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+URLSET_CLOSE = b"</urlset>\n"
+
+
+def as_datetime(value):
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def url_fragment(loc: str, lastmod=None, changefreq: str = None, priority: str = None) -> bytes:
+    parts = [f"<url><loc>{escape(loc)}</loc>"]
+    if lastmod is not None:
+        parts.append(f"<lastmod>{as_datetime(lastmod).date().isoformat()}</lastmod>")
+    if changefreq:
+        parts.append(f"<changefreq>{changefreq}</changefreq>")
+    if priority:
+        parts.append(f"<priority>{priority}</priority>")
+    parts.append("</url>\n")
+    return "".join(parts).encode("utf-8")
+
+
+class SiteFeeds:
+    """Sitemap and RSS fragments for the public site at `site_url`."""
+
+    def __init__(self, site_url: str, title: str, description: str):
+        self.site_url = site_url.rstrip("/")
+        self.title = title
+        self.description = description
+        self._static = [url_fragment(self.site_url + path, None, freq, prio) for path, freq, prio in STATIC_PAGES]
+        self._categories = []
+        self._articles = {}  # article id -> (created_at, url fragment, item fragment)
+        self._feed = None    # cached RSS bytes, None when stale
+
+    def load(self, articles, categories):
+        self._articles = {}
+        for article in articles:
+            self._articles[article["id"]] = self._render_article(article)
+        self.set_categories(categories)
+
+    def upsert_article(self, article: dict):
+        if article.get("is_published"):
+            self._articles[article["id"]] = self._render_article(article)
+        else:
+            self._articles.pop(article["id"], None)
+        self._feed = None
+
+    def remove_article(self, article_id: str):
+        if self._articles.pop(article_id, None) is not None:
+            self._feed = None
+
+    def set_categories(self, categories):
+        self._categories = [
+            url_fragment(f"{self.site_url}/category/{category['slug']}", None, "weekly", "0.7")
+            for category in categories
+        ]
+
+    def sitemap_chunks(self) -> int:
+        total = len(self._static) + len(self._categories) + len(self._articles)
+        return max(1, -(-total // MAX_SITEMAP_URLS))
+
+    def iter_sitemap(self, chunk: int = 0):
+        """One sitemap chunk as a <urlset>, yielded STREAM_BATCH urls at a time.
+
+        The chunk's fragments are copied when this is called, so the returned
+        generator can be consumed from a worker thread while article writes
+        keep changing the index on the event loop."""
+        start = chunk * MAX_SITEMAP_URLS
+        fragments = self._static + self._categories + [entry[1] for entry in self._articles.values()]
+        return self._stream(fragments[start:start + MAX_SITEMAP_URLS])
+
+    @staticmethod
+    def _stream(fragments: list):
+        yield URLSET_OPEN
+        for offset in range(0, len(fragments), STREAM_BATCH):
+            yield b"".join(fragments[offset:offset + STREAM_BATCH])
+        yield URLSET_CLOSE
+
+    def chunk_url(self, chunk: int) -> str:
+        """Public URL of sitemap chunk `chunk` (0-based). Chunks are served by the
+        API router, so the link keeps the /api prefix the public host routes to it."""
+        return f"{self.site_url}/api/sitemap-{chunk + 1}.xml"
+
+    def sitemap_index(self) -> bytes:
+        """<sitemapindex> listing every chunk at its public URL."""
+        entries = "".join(
+            f"<sitemap><loc>{escape(self.chunk_url(n))}</loc></sitemap>\n" for n in range(self.sitemap_chunks())
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{entries}</sitemapindex>\n"
+        ).encode("utf-8")
+
+    def feed(self) -> bytes:
+        """RSS 2.0 feed of the FEED_SIZE newest published articles."""
+        if self._feed is None:
+            newest = heapq.nlargest(FEED_SIZE, self._articles.values(), key=lambda entry: entry[0])
+            updated = format_datetime(newest[0][0]) if newest else format_datetime(datetime.now(timezone.utc))
+            head = (
+                '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>\n'
+                f"<title>{escape(self.title)}</title>\n"
+                f"<link>{escape(self.site_url)}/</link>\n"
+                f"<description>{escape(self.description)}</description>\n"
+                f"<lastBuildDate>{updated}</lastBuildDate>\n"
+            ).encode("utf-8")
+            self._feed = head + b"".join(entry[2] for entry in newest) + b"</channel></rss>\n"
+        return self._feed
+
+    def stats(self) -> dict:
+        return {
+            "articles": len(self._articles),
+            "categories": len(self._categories),
+            "sitemap_chunks": self.sitemap_chunks(),
+        }
+
+    def _render_article(self, article: dict):
+        link = f"{self.site_url}/article/{article['slug']}"
+        created_at = as_datetime(article["created_at"])
+        item = (
+            f"<item><title>{escape(article['title'])}</title>"
+            f"<link>{escape(link)}</link>"
+            f'<guid isPermaLink="false">{escape(article["id"])}</guid>'
+            f"<pubDate>{format_datetime(created_at)}</pubDate>"
+            f"<description>{escape(article.get('excerpt') or '')}</description></item>\n"
+        ).encode("utf-8")
+        url = url_fragment(link, article.get("updated_at") or created_at, "monthly", "0.8")
+        return created_at, url, item
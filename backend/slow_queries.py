@@ -0,0 +1,215 @@
+"""
+Slow MongoDB query log with background explain plans.
+
+SlowQueryLog is a pymongo CommandListener. Any find/aggregate/count/distinct
+that takes longer than the threshold is logged with its filter, sort and
+projection (literal values masked, so emails and ids stay out of the log).
+The command is then re-run as `explain` with executionStats on the event
+loop, at most once per query shape per explain interval, and the plan is
+logged as one line:
+
+    slow find on articles: 412.3ms filter={"category_id": "?", "is_published": "?"}
+        sort={"created_at": -1} projection={"_id": 0}
+    explain find on articles: COLLSCAN keys=0 docs=18250 returned=12 (398ms)
+
+Explains are queued and dropped when the queue is full, so a burst of slow
+queries never turns into a burst of extra load.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = frozenset(("find", "aggregate", "count", "distinct"))
+EXPLAIN_QUEUE_SIZE = 16
+SHAPE_CACHE_SIZE = 512
+MAX_LOGGED_CHARS = 400
+
+
+def mask_values(value):
+    """Keep field names and operators, replace every literal with "?"."""
+    if isinstance(value, dict):
+        return {key: mask_values(inner) for key, inner in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [mask_values(inner) for inner in value]
+    return "?"
+
+
+def compact(value) -> str:
+    text = json.dumps(value, default=str, separators=(", ", ": "))
+    return text if len(text) <= MAX_LOGGED_CHARS else text[:MAX_LOGGED_CHARS] + "..."
+
+
+def query_parts(command_name: str, command) -> dict:
+    """Filter, sort and projection of a command; aggregate reports its pipeline
+    with the literals of $match stages masked."""
+    if command_name == "aggregate":
+        pipeline = [
+            {stage: mask_values(body) if stage == "$match" else body for stage, body in step.items()}
+            for step in command.get("pipeline", [])
+        ]
+        return {"pipeline": pipeline}
+    parts = {"filter": mask_values(command.get("filter" if command_name == "find" else "query") or {})}
+    if command_name == "distinct":
+        parts["key"] = command.get("key")
+    if command.get("sort"):
+        parts["sort"] = dict(command["sort"])
+    if command.get("projection"):
+        parts["projection"] = dict(command["projection"])
+    return parts
+
+
+def explain_command(command) -> dict:
+    """The original command without driver-added fields ($db, lsid, ...)."""
+    return {key: value for key, value in command.items() if not key.startswith("$") and key != "lsid"}
+
+
+def find_key(document, key):
+    """First value stored under `key` anywhere in a nested explain document."""
+    if isinstance(document, dict):
+        if key in document:
+            return document[key]
+        children = document.values()
+    elif isinstance(document, list):
+        children = document
+    else:
+        return None
+    for child in children:
+        found = find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+
+def plan_stages(plan) -> list:
+    stages = []
+    while isinstance(plan, dict):
+        stage = plan.get("stage")
+        if stage:
+            stages.append(f"{stage}({plan['indexName']})" if plan.get("indexName") else stage)
+        for child in plan.get("inputStages", [])[1:]:
+            stages.extend(plan_stages(child))
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0] or plan.get("queryPlan")
+    return stages
+
+
+def summarize_explain(explain: dict) -> str:
+    planner = find_key(explain, "queryPlanner") or {}
+    stages = plan_stages(planner.get("winningPlan"))
+    scans = [stage for stage in stages if stage == "COLLSCAN" or stage.startswith("IXSCAN")]
+    stats = find_key(explain, "executionStats") or {}
+    return (
+        f"{', '.join(scans) or ' > '.join(reversed(stages)) or 'no plan'} "
+        f"keys={stats.get('totalKeysExamined', '?')} docs={stats.get('totalDocsExamined', '?')} "
+        f"returned={stats.get('nReturned', '?')} ({stats.get('executionTimeMillis', '?')}ms)"
+    )
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    """Logs commands slower than `threshold_ms` and explains them in the background.
+
+    Events arrive on driver threads, so explains are handed to the event loop
+    captured by start(); before start() (or with explain_interval 0) slow
+    queries are logged without a plan."""
+
+    def __init__(self, threshold_ms: float, explain_interval: float):
+        self.threshold_micros = threshold_ms * 1000
+        self.explain_interval = explain_interval
+        self.logged = 0
+        self.explained = 0
+        self.dropped = 0
+        self._pending = {}            # (connection_id, request_id) -> command
+        self._last_explained = OrderedDict()  # query shape -> monotonic time
+        self._lock = threading.Lock()
+        self._db = None
+        self._loop = None
+        self._queue = None
+        self._task = None
+
+    def start(self, db):
+        self._db = db
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(EXPLAIN_QUEUE_SIZE)
+        if self.explain_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+
+    def started(self, event):
+        if event.command_name in EXPLAINABLE:
+            self._pending[(event.connection_id, event.request_id)] = event.command
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event)
+
+    def stats(self) -> dict:
+        return {
+            "threshold_ms": self.threshold_micros / 1000,
+            "logged": self.logged,
+            "explained": self.explained,
+            "explains_dropped": self.dropped,
+        }
+
+    def _finish(self, event):
+        command = self._pending.pop((event.connection_id, event.request_id), None)
+        if command is None or event.duration_micros < self.threshold_micros:
+            return
+        name = event.command_name
+        collection = command.get(name)
+        parts = query_parts(name, command)
+        self.logged += 1
+        logger.warning(
+            "slow %s on %s: %.1fms %s", name, collection, event.duration_micros / 1000,
+            " ".join(f"{key}={compact(value)}" for key, value in parts.items()),
+        )
+        if self._should_explain((collection, name, compact(parts))):
+            self._loop.call_soon_threadsafe(self._enqueue, (collection, name, explain_command(command)))
+
+    def _should_explain(self, shape) -> bool:
+        if self._task is None or self._loop is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_explained.get(shape)
+            if last is not None and now - last < self.explain_interval:
+                return False
+            self._last_explained[shape] = now
+            self._last_explained.move_to_end(shape)
+            while len(self._last_explained) > SHAPE_CACHE_SIZE:
+                self._last_explained.popitem(last=False)
+        return True
+
+    def _enqueue(self, item):
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _run(self):
+        while True:
+            collection, name, command = await self._queue.get()
+            try:
+                explain = await self._db.command({"explain": command, "verbosity": "executionStats"})
+            except Exception as exc:
+                logger.info("explain %s on %s failed: %s", name, collection, exc)
+                continue
+            self.explained += 1
+            logger.warning("explain %s on %s: %s", name, collection, summarize_explain(explain))
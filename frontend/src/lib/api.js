@@ -54,7 +54,7 @@ export const categoriesAPI = {
 // Articles API
 export const articlesAPI = {
   getAll: (params) => api.get('/articles', { params }),
-  getAllAdmin: () => api.get('/articles/all'),
+  getAllAdmin: (params) => api.get('/articles/all', { params }),
   getBySlug: (slug) => api.get(`/articles/${slug}`),
   getWeeklyUpdates: () => api.get('/articles/weekly-updates'),
   create: (data) => api.post('/articles', data),
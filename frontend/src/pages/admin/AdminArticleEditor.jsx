@@ -43,7 +43,7 @@ export default function AdminArticleEditor() {
         setCategories(categoriesRes.data);
 
         if (isEditing) {
-          const articlesRes = await articlesAPI.getAllAdmin();
+          const articlesRes = await articlesAPI.getAllAdmin({ include: 'content' });
           const article = articlesRes.data.find((a) => a.id === id);
           if (article) {
             setFormData({
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Concurrent load test for the RestfulMind API.
+
+Replays the backend_test.py scenarios as weighted mixes from many concurrent
+virtual users against a local app, then prints per-route throughput and
+p50/p95/p99 latency as JSON so runs can be compared across commits.
+
+    # against an already running app
+    python load_test.py --base-url http://localhost:8001 --mix reads -c 50 -d 30
+
+    # start uvicorn from backend/ against a local mongod (seed it first with
+    # backend/seed_data.py using the same MONGO_URL and DB_NAME)
+    MONGO_URL=mongodb://localhost:27017 DB_NAME=restfulmind_load \\
+        python load_test.py --start-server --mix mixed -o results.json
+
+The admin scenario creates, edits and deletes its own throwaway articles, and
+the signup scenario adds subscribers, so point it at a disposable database.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from backend_test import RestfulMindAPITester
+
+ROOT_DIR = Path(__file__).parent
+ADMIN_CREDENTIALS = RestfulMindAPITester().admin_credentials
+SEARCH_TERMS = ["sleep", "stress", "anxiety", "meditation", "nutrition", "exercise"]
+STATIC_PAGES = ["privacy", "terms", "disclaimer"]
+
+# Scenario weights per mix; each scenario is one page view or user action
+MIXES = {
+    "reads": {
+        "home": 25, "category_page": 20, "article_page": 40,
+        "weekly_updates": 5, "static_page": 5, "search": 5,
+    },
+    "mixed": {
+        "home": 22, "category_page": 18, "article_page": 36,
+        "weekly_updates": 5, "static_page": 4, "search": 5,
+        "signup": 8, "admin_edit": 2,
+    },
+    "signup-burst": {"signup": 80, "home": 20},
+    "admin": {"admin_edit": 70, "admin_dashboard": 30},
+}
+
+
+class Recorder:
+    """Latencies and status codes per method and route template."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+
+    async def request(self, client, method, route, url, expected=200, **kwargs):
+        route = f"{method} {route}"
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            self.errors[route] += 1
+            self.statuses[route][type(exc).__name__] += 1
+            return None
+        self.latencies[route].append(time.perf_counter() - start)
+        self.statuses[route][str(response.status_code)] += 1
+        if response.status_code != expected:
+            self.errors[route] += 1
+            return None
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        routes = {}
+        for route in sorted(set(self.latencies) | set(self.errors)):
+            samples = sorted(self.latencies[route])
+            routes[route] = {
+                "requests": sum(self.statuses[route].values()),
+                "errors": self.errors[route],
+                "throughput_rps": round(len(samples) / elapsed, 2),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+                "p99_ms": percentile(samples, 99),
+                "max_ms": round(samples[-1] * 1000, 2) if samples else None,
+                "statuses": dict(self.statuses[route]),
+            }
+        total = sum(route["requests"] for route in routes.values())
+        return {
+            "requests": total,
+            "errors": sum(route["errors"] for route in routes.values()),
+            "throughput_rps": round(total / elapsed, 2),
+            "routes": routes,
+        }
+
+
+def percentile(samples: list, pct: float):
+    """Nearest-rank percentile of sorted samples, in milliseconds."""
+    if not samples:
+        return None
+    rank = min(len(samples), max(1, math.ceil(pct / 100 * len(samples)))) - 1
+    return round(samples[rank] * 1000, 2)
+
+
+class VirtualUser:
+    def __init__(self, number: int, client, recorder: Recorder, fixtures: dict, seed: int, run_id: str):
+        self.number = number
+        self.client = client
+        self.recorder = recorder
+        self.fixtures = fixtures
+        self.random = random.Random(seed + number)
+        self.run_id = run_id
+        self.token = None
+        self.actions = 0
+
+    def get(self, route, url, **kwargs):
+        return self.recorder.request(self.client, "GET", route, url, **kwargs)
+
+    # ---- public pages, as the frontend requests them ----
+
+    async def home(self):
+        await asyncio.gather(
+            self.get("/api/articles?limit", "/api/articles", params={"limit": 12}),
+            self.get("/api/categories", "/api/categories"),
+        )
+
+    async def category_page(self):
+        slug = self.random.choice(self.fixtures["categories"])
+        await asyncio.gather(
+            self.get("/api/categories/{slug}", f"/api/categories/{slug}"),
+            self.get("/api/articles?category", "/api/articles", params={"category": slug}),
+        )
+
+    async def article_page(self):
+        article = self.random.choice(self.fixtures["articles"])
+        await self.get("/api/articles/{slug}", f"/api/articles/{article['slug']}")
+        calls = [self.get("/api/articles/{slug}/related", f"/api/articles/{article['slug']}/related")]
+        if article["category"]:
+            calls.append(self.get(
+                "/api/articles?category&limit", "/api/articles",
+                params={"category": article["category"], "limit": 4},
+            ))
+        await asyncio.gather(*calls)
+
+    async def weekly_updates(self):
+        await self.get("/api/articles/weekly-updates", "/api/articles/weekly-updates")
+
+    async def static_page(self):
+        await self.get("/api/content/{page_type}", f"/api/content/{self.random.choice(STATIC_PAGES)}")
+
+    async def search(self):
+        await self.get("/api/articles/search", "/api/articles/search", params={"q": self.random.choice(SEARCH_TERMS)})
+
+    async def signup(self):
+        self.actions += 1
+        await self.recorder.request(self.client, "POST", "/api/subscribers", "/api/subscribers", json={
+            "email": f"load-{self.run_id}-{self.number}-{self.actions}@example.com",
+            "interests": self.random.sample(self.fixtures["categories"], min(2, len(self.fixtures["categories"]))),
+            "gdpr_consent": True,
+        })
+
+    # ---- admin session ----
+
+    async def login(self) -> bool:
+        response = await self.recorder.request(
+            self.client, "POST", "/api/auth/login", "/api/auth/login", json=ADMIN_CREDENTIALS
+        )
+        if response is not None:
+            self.token = response.json()["access_token"]
+        return self.token is not None
+
+    def auth(self) -> dict:
+        return {"headers": {"Authorization": f"Bearer {self.token}"}}
+
+    async def admin_dashboard(self):
+        if self.token is None and not await self.login():
+            return
+        await asyncio.gather(
+            self.get("/api/stats/dashboard", "/api/stats/dashboard", **self.auth()),
+            self.get("/api/articles/all", "/api/articles/all", params={"limit": 50}, **self.auth()),
+            self.get("/api/subscribers/stats", "/api/subscribers/stats", **self.auth()),
+        )
+
+    async def admin_edit(self):
+        """Open the editor, write a draft, save it twice, publish, then delete it."""
+        if self.token is None and not await self.login():
+            return
+        await self.get("/api/articles/all", "/api/articles/all", params={"include": "content"}, **self.auth())
+        self.actions += 1
+        slug = f"load-{self.run_id}-{self.number}-{self.actions}"
+        response = await self.recorder.request(self.client, "POST", "/api/articles", "/api/articles", json={
+            "title": f"Load test draft {slug}",
+            "slug": slug,
+            "excerpt": "Draft written by the load test.",
+            "content": "## Draft\n\n" + " ".join(self.random.choices(SEARCH_TERMS, k=200)),
+            "category_id": self.random.choice(self.fixtures["category_ids"]),
+            "is_published": False,
+        }, **self.auth())
+        if response is None:
+            return
+        article_id = response.json()["id"]
+        for update in ({"excerpt": "Edited once."}, {"excerpt": "Edited twice."}, {"is_published": True}):
+            await self.recorder.request(
+                self.client, "PUT", "/api/articles/{article_id}", f"/api/articles/{article_id}",
+                json=update, **self.auth(),
+            )
+        await self.recorder.request(
+            self.client, "DELETE", "/api/articles/{article_id}", f"/api/articles/{article_id}", **self.auth()
+        )
+
+    async def run(self, mix: dict, deadline: float):
+        names, weights = list(mix), list(mix.values())
+        while time.perf_counter() < deadline:
+            await getattr(self, self.random.choices(names, weights)[0])()
+
+
+async def load_fixtures(client) -> dict:
+    categories = (await client.get("/api/categories")).raise_for_status().json()
+    articles = (await client.get("/api/articles")).raise_for_status().json()
+    if not categories or not articles:
+        raise SystemExit("No categories or articles to read; seed the database with backend/seed_data.py first")
+    slugs = {category["id"]: category["slug"] for category in categories}
+    return {
+        "categories": list(slugs.values()),
+        "category_ids": list(slugs),
+        "articles": [
+            {"slug": article["slug"], "category": slugs.get(article.get("category_id"))}
+            for article in articles
+        ],
+    }
+
+
+async def wait_until_healthy(client, timeout: float = 30):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await client.get("/api/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.perf_counter() > deadline:
+            raise SystemExit(f"API at {client.base_url} did not become healthy within {timeout}s")
+        await asyncio.sleep(0.5)
+
+
+def start_server(port: int):
+    env = dict(os.environ)
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "restfulmind_load")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT_DIR / "backend", env=env,
+    )
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        await wait_until_healthy(client)
+        fixtures = await load_fixtures(client)
+        recorder = Recorder()
+        run_id = uuid.uuid4().hex[:8]
+        users = [VirtualUser(n, client, recorder, fixtures, args.seed, run_id) for n in range(args.concurrency)]
+        started_at = datetime.now(timezone.utc).isoformat()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(user.run(MIXES[args.mix], deadline) for user in users))
+        elapsed = time.perf_counter() - started
+    return {
+        "run": {
+            "started_at": started_at,
+            "revision": git_revision(),
+            "base_url": args.base_url,
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration_s": round(elapsed, 2),
+        },
+        **recorder.summary(elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for the RestfulMind API.")
+    parser.add_argument("--base-url", default=None, help="API to load (default: http://localhost:PORT)")
+    parser.add_argument("--start-server", action="store_true", help="start uvicorn from backend/ for the run")
+    parser.add_argument("--port", type=int, default=8001, help="port for --start-server and the default base URL")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="reads", help="scenario mix")
+    parser.add_argument("-c", "--concurrency", type=int, default=20, help="virtual users")
+    parser.add_argument("-d", "--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for scenario choice")
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    args.base_url = args.base_url or f"http://localhost:{args.port}"
+
+    server = start_server(args.port) if args.start_server else None
+    try:
+        report = asyncio.run(run_load(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+        print(f"{report['requests']} requests, {report['throughput_rps']} req/s, "
+              f"{report['errors']} errors -> {args.output}")
+    else:
+        print(text)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# The backend runs as flat modules from its own directory (uvicorn server:app)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+
+@pytest.fixture
+def mongo_db(monkeypatch):
+    """Run `await test(db)` against a throwaway database on MONGO_URL, with the
+    app's indexes built and installed as server.db. Skips when no MongoDB is
+    reachable; the database is dropped afterwards."""
+    import server
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo.errors import PyMongoError
+
+    def run(test):
+        async def main():
+            client = AsyncIOMotorClient(os.environ["MONGO_URL"], tz_aware=True, serverSelectionTimeoutMS=500)
+            try:
+                try:
+                    await client.admin.command("ping")
+                except PyMongoError:
+                    pytest.skip("MongoDB is not reachable at MONGO_URL")
+                db = client[f"test_{uuid.uuid4().hex[:12]}"]
+                monkeypatch.setattr(server, "db", db)
+                try:
+                    await server.ensure_indexes()
+                    return await test(db)
+                finally:
+                    await client.drop_database(db.name)
+            finally:
+                client.close()
+
+        return asyncio.run(main())
+
+    return run
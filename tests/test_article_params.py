@@ -0,0 +1,21 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+
+@pytest.fixture
+def client():
+    server.app.dependency_overrides[server.get_current_user] = lambda: {"id": "admin"}
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path", ["/api/articles", "/api/articles/all"])
+@pytest.mark.parametrize("limit", [0, -1, 100000])
+def test_out_of_range_limit_is_a_422(client, path, limit):
+    assert client.get(path, params={"limit": limit}).status_code == 422
+
+
+def test_negative_skip_is_a_422(client):
+    assert client.get("/api/articles", params={"skip": -5}).status_code == 422
@@ -0,0 +1,21 @@
+import asyncio
+
+import server
+
+
+def test_indexes_still_build_when_migrations_fail(monkeypatch):
+    calls = []
+
+    async def fail(*args):
+        calls.append("migration")
+        raise RuntimeError("mongo went away")
+
+    async def build():
+        calls.append("build")
+
+    monkeypatch.setattr(server, "backfill_search_text", fail)
+    monkeypatch.setattr(server, "migrate_timestamps", fail)
+    monkeypatch.setattr(server, "rebuild_related_index", fail)
+    monkeypatch.setattr(server, "reload_site_feeds", build)
+    asyncio.run(server.run_background_migrations())
+    assert calls == ["migration", "migration", "migration", "build"]
@@ -0,0 +1,33 @@
+import gzip
+
+import pytest
+
+import server
+from server import CompressedBody, negotiate_encoding
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("", "identity"),
+    ("gzip", "gzip"),
+    ("deflate, gzip;q=0.5", "gzip"),
+    ("GZIP", "gzip"),
+    ("gzip;q=0", "identity"),
+    ("gzip; q=0.0, identity", "identity"),
+    ("compress, deflate", "identity"),
+])
+def test_negotiate_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(server, "brotli", None)
+    assert negotiate_encoding(header) == expected
+
+
+def test_brotli_preferred_when_available(monkeypatch):
+    monkeypatch.setattr(server, "brotli", object())
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0") == "gzip"
+
+
+def test_gzip_variant_round_trips_and_is_cached():
+    body = CompressedBody(b'{"title": "Sleep"}' * 100)
+    compressed = body.get("gzip")
+    assert gzip.decompress(compressed) == body.get("identity")
+    assert body.get("gzip") is compressed
@@ -0,0 +1,74 @@
+import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+import server
+from server import ContentVersions, not_modified
+
+
+def request_with(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.fixture
+def etag():
+    return ContentVersions(300).etag(["articles"], "some-slug")
+
+
+def test_etags_are_weak(etag):
+    assert etag.startswith('W/"')
+
+
+def test_no_header_tags_the_response(etag):
+    response = Response()
+    assert not_modified(request_with(), response, etag, "public, max-age=60") is None
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+
+
+@pytest.mark.parametrize("header", ["{etag}", "{strong}", '"other", {etag}'])
+def test_matching_tag_is_a_304(etag, header):
+    header = header.format(etag=etag, strong=etag.removeprefix("W/"))
+    cached = not_modified(request_with(header), Response(), etag)
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("header", ['W/"other"', "*"])
+def test_other_tags_are_not_a_304(etag, header):
+    assert not_modified(request_with(header), Response(), etag) is None
+
+
+def test_star_does_not_hide_a_missing_resource():
+    client = TestClient(server.app)
+    response = client.get("/api/categories/no-such-category", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+def test_bump_changes_only_the_tags_that_read_the_collection():
+    versions = ContentVersions(300)
+    articles, categories = versions.etag(["articles"]), versions.etag(["categories"])
+    versions.bump("articles")
+    assert versions.get("articles") == 1
+    assert versions.etag(["articles"]) != articles
+    assert versions.etag(["categories"]) == categories
+
+
+def test_tags_differ_per_request_parts_and_process():
+    versions = ContentVersions(300)
+    assert versions.etag(["articles"], "a") == versions.etag(["articles"], "a")
+    assert versions.etag(["articles"], "a") != versions.etag(["articles"], "b")
+    assert ContentVersions(300).etag(["articles"], "a") != versions.etag(["articles"], "a")
+
+
+def test_tags_roll_over_after_max_age(monkeypatch):
+    versions = ContentVersions(300)
+    now = [3000.0]
+    monkeypatch.setattr(server.time, "time", lambda: now[0])
+    first = versions.etag(["articles"])
+    now[0] += 299
+    assert versions.etag(["articles"]) == first
+    now[0] += 1
+    assert versions.etag(["articles"]) != first
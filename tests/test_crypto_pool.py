@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from server import CryptoPool
+
+
+def test_rejects_calls_beyond_size_plus_queue_limit():
+    pool = CryptoPool(size=1, queue_limit=1)
+    release = threading.Event()
+
+    def slow_hash(value):
+        release.wait(5)
+        return value * 2
+
+    async def main():
+        running = [asyncio.create_task(pool.run(slow_hash, n)) for n in (1, 2)]
+        await asyncio.sleep(0)
+        assert pool.stats()["in_flight"] == 2
+        assert pool.stats()["queued"] == 1
+
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(slow_hash, 3)
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.headers == {"Retry-After": "1"}
+
+        release.set()
+        return await asyncio.gather(*running)
+
+    try:
+        assert asyncio.run(main()) == [2, 4]
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 2
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+
+
+def test_accepts_new_calls_once_the_backlog_drains():
+    pool = CryptoPool(size=1, queue_limit=0)
+
+    async def main():
+        return [await pool.run(str.upper, word) for word in ("a", "b", "c")]
+
+    try:
+        assert asyncio.run(main()) == ["A", "B", "C"]
+    finally:
+        pool.shutdown()
+    assert pool.stats()["rejected"] == 0
@@ -0,0 +1,60 @@
+import server
+from server import ArticleUpdate
+
+ADMIN = {"id": "admin"}
+COUNTER_FIELDS = ("total_articles", "published_articles", "total_views", "total_subscribers")
+
+
+async def counters() -> dict:
+    doc = await server.db.counters.find_one({"_id": server.COUNTERS_ID})
+    return {field: doc.get(field, 0) for field in COUNTER_FIELDS}
+
+
+async def recount() -> dict:
+    articles = await server.collect_article_stats()
+    subscribers = await server.collect_subscriber_stats()
+    return {**articles, "total_subscribers": subscribers["total"]}
+
+
+def test_write_routes_keep_counters_equal_to_a_recount(mongo_db, monkeypatch):
+    # The in-memory related/feed tables are not under test here
+    monkeypatch.setattr(server, "refresh_article_indexes", lambda article: None)
+    monkeypatch.setattr(server, "drop_article_indexes", lambda article_id: None)
+
+    async def test(db):
+        await db.articles.insert_many([
+            {"id": "a", "slug": "a", "is_published": True, "views": 3},
+            {"id": "b", "slug": "b", "is_published": False, "views": 0},
+        ])
+        await db.subscribers.insert_many([
+            {"id": "s1", "email": "one@example.com", "is_active": True},
+            {"id": "s2", "email": "two@example.com", "is_active": False},
+        ])
+        await server.reconcile_counters()
+        seen = []
+
+        async def check():
+            assert await counters() == await recount()
+            seen.append(await counters())
+
+        await server.update_article("b", ArticleUpdate(is_published=True), current_user=ADMIN)
+        await check()
+        # Publishing an already published article changes nothing
+        await server.update_article("b", ArticleUpdate(is_published=True), current_user=ADMIN)
+        await check()
+        await server.update_article("a", ArticleUpdate(is_published=False), current_user=ADMIN)
+        await check()
+        await server.delete_article("a", current_user=ADMIN)
+        await check()
+        await server.unsubscribe("s1", current_user=ADMIN)
+        await check()
+        # Unsubscribing an inactive address changes nothing
+        await server.unsubscribe("s1", current_user=ADMIN)
+        await server.unsubscribe("s2", current_user=ADMIN)
+        await check()
+        return seen
+
+    seen = mongo_db(test)
+    assert [state["published_articles"] for state in seen] == [2, 2, 1, 1, 1, 1]
+    assert seen[3] == {"total_articles": 1, "published_articles": 1, "total_views": 0, "total_subscribers": 1}
+    assert seen[-1]["total_subscribers"] == 0
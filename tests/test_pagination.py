@@ -0,0 +1,38 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from server import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    query = decode_cursor(encode_cursor({"created_at": created_at, "id": "abc"}))
+    assert query == {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$lt": "abc"}},
+    ]}
+
+
+def test_cursor_accepts_legacy_string_timestamps():
+    query = decode_cursor(encode_cursor({"created_at": "2024-05-01T12:30:00+00:00", "id": "abc"}))
+    assert query["$or"][1]["created_at"] == datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor({"created_at": datetime(2024, 5, 1, tzinfo=timezone.utc), "id": "?>?>?>"})
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"[]").decode(),
+    base64.urlsafe_b64encode(b'{"c": "yesterday", "i": "x"}').decode(),
+    base64.urlsafe_b64encode(b'{"i": "x"}').decode(),
+])
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+import server
+from server import PrincipalCache
+
+ADMIN = {"id": "admin", "email": "admin@example.com"}
+EDITOR = {"id": "editor", "email": "editor@example.com"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    return now
+
+
+def far_future():
+    return time.time() + 3600
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = PrincipalCache(ttl_seconds=60, maxsize=10)
+    cache.put("token", ADMIN, far_future())
+    clock[0] += 59
+    assert cache.get("token") == ADMIN
+    clock[0] += 1
+    assert cache.get("token") is None
+    assert cache.stats() == {"size": 0, "maxsize": 10, "hits": 1, "misses": 1}
+
+
+def test_ttl_is_clamped_to_the_token_expiry(clock):
+    cache = PrincipalCache(ttl_seconds=60, maxsize=10)
+    cache.put("token", ADMIN, time.time() + 5)
+    clock[0] += 4
+    assert cache.get("token") == ADMIN
+    clock[0] += 2
+    assert cache.get("token") is None
+
+
+def test_expired_tokens_are_not_cached(clock):
+    cache = PrincipalCache(ttl_seconds=60, maxsize=10)
+    cache.put("token", ADMIN, time.time() - 1)
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_evicts_the_least_recently_used_token(clock):
+    cache = PrincipalCache(ttl_seconds=60, maxsize=2)
+    cache.put("a", ADMIN, far_future())
+    cache.put("b", EDITOR, far_future())
+    assert cache.get("a") == ADMIN
+    cache.put("c", EDITOR, far_future())
+    assert cache.get("b") is None
+    assert cache.get("a") == ADMIN
+    assert cache.get("c") == EDITOR
+
+
+def test_invalidate_user_drops_all_of_their_tokens(clock):
+    cache = PrincipalCache(ttl_seconds=60, maxsize=10)
+    cache.put("laptop", ADMIN, far_future())
+    cache.put("phone", ADMIN, far_future())
+    cache.put("other", EDITOR, far_future())
+    cache.invalidate_user("admin")
+    assert cache.get("laptop") is None
+    assert cache.get("phone") is None
+    assert cache.get("other") == EDITOR
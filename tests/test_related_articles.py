@@ -0,0 +1,72 @@
+import pytest
+
+from related_articles import RelatedArticlesIndex
+
+TOPICS = {
+    "sleep": "sleep insomnia bedtime melatonin circadian rhythm nap dreams",
+    "food": "nutrition protein vegetables fiber vitamins digestion meal",
+    "stress": "stress anxiety cortisol breathing meditation calm worry",
+}
+
+
+def article(n, topic, extra=""):
+    return {
+        "id": f"id-{topic}-{n}", "slug": f"{topic}-{n}", "title": f"{topic.title()} guide {n}",
+        "excerpt": TOPICS[topic].split()[n % 7], "search_text": f"{TOPICS[topic]} {extra}",
+    }
+
+
+CATALOGUE = [article(n, topic, f"note{n}") for topic in TOPICS for n in range(4)]
+
+
+def neighbours(index, slug):
+    return {summary["slug"] for summary, _ in index.related(slug)}
+
+
+def scores(index, slug):
+    return {summary["slug"]: pytest.approx(score) for summary, score in index.related(slug)}
+
+
+def test_related_stays_on_topic_and_excludes_self():
+    index = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    related = index.related("sleep-0")
+    assert {summary["slug"] for summary, _ in related} == {"sleep-1", "sleep-2", "sleep-3"}
+    assert [score for _, score in related] == sorted((score for _, score in related), reverse=True)
+    assert all("search_text" not in summary for summary, _ in related)
+
+
+def test_reupserting_an_unchanged_article_matches_a_fresh_build():
+    fresh = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    updated = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    updated.upsert(CATALOGUE[5])
+    for item in CATALOGUE:
+        # Equal scores may come back in a different order, so compare as a mapping
+        assert scores(updated, item["slug"]) == scores(fresh, item["slug"])
+
+
+def test_incremental_upsert_matches_fresh_build_neighbours():
+    new = article(9, "stress", "note9")
+    incremental = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    incremental.upsert(new)
+    fresh = RelatedArticlesIndex.build(CATALOGUE + [new], top_k=3)
+    for item in CATALOGUE + [new]:
+        assert neighbours(incremental, item["slug"]) == neighbours(fresh, item["slug"])
+
+
+def test_remove_matches_fresh_build_neighbours():
+    incremental = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    incremental.remove("id-food-2")
+    remaining = [item for item in CATALOGUE if item["id"] != "id-food-2"]
+    fresh = RelatedArticlesIndex.build(remaining, top_k=3)
+    assert len(incremental) == len(remaining)
+    assert incremental.related("food-2") == []
+    for item in remaining:
+        assert neighbours(incremental, item["slug"]) == neighbours(fresh, item["slug"])
+        assert "food-2" not in neighbours(incremental, item["slug"])
+
+
+def test_upsert_with_new_slug_drops_the_old_one():
+    index = RelatedArticlesIndex.build(CATALOGUE, top_k=3)
+    index.upsert({**CATALOGUE[0], "slug": "sleep-renamed"})
+    assert index.related("sleep-0") == []
+    assert "sleep-renamed" in neighbours(index, "sleep-1")
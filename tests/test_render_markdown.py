@@ -0,0 +1,35 @@
+import pytest
+
+from server import get_default_disclaimer, get_default_privacy_policy, get_default_terms, render_markdown
+
+
+def test_headings_and_paragraphs():
+    html = render_markdown("## Introduction\nFirst line\nsame paragraph\n\nSecond paragraph\n### Details")
+    assert html.split("\n") == [
+        "<h2>Introduction</h2>",
+        "<p>First line same paragraph</p>",
+        "<p>Second paragraph</p>",
+        "<h3>Details</h3>",
+    ]
+
+
+def test_lists_and_inline_emphasis():
+    html = render_markdown("We collect:\n- **Email** addresses\n- *Usage* data\nThat is all.")
+    assert html.split("\n") == [
+        "<p>We collect:</p>",
+        "<ul><li><strong>Email</strong> addresses</li><li><em>Usage</em> data</li></ul>",
+        "<p>That is all.</p>",
+    ]
+
+
+def test_html_is_escaped():
+    assert render_markdown("<script>alert(1)</script> & more") == (
+        "<p>&lt;script&gt;alert(1)&lt;/script&gt; &amp; more</p>"
+    )
+
+
+@pytest.mark.parametrize("default_page", [get_default_privacy_policy, get_default_terms, get_default_disclaimer])
+def test_default_pages_render(default_page):
+    html = render_markdown(default_page())
+    assert html.startswith("<h2>")
+    assert "##" not in html and "**" not in html
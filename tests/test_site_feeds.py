@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+import site_feeds
+from site_feeds import SiteFeeds, STATIC_PAGES
+
+NOW = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def article(n, published=True, **extra):
+    return {
+        "id": f"id-{n}", "slug": f"article-{n}", "title": f"Article {n} & more", "excerpt": "Why sleep <matters>",
+        "created_at": NOW + timedelta(days=n), "is_published": published, **extra,
+    }
+
+
+def feeds(articles=(), categories=({"slug": "sleep-rest"},)):
+    feeds = SiteFeeds("https://example.com/", "RestfulMind", "Wellness")
+    feeds.load(articles, categories)
+    return feeds
+
+
+def sitemap(feeds, chunk=0):
+    return b"".join(feeds.iter_sitemap(chunk)).decode()
+
+
+def test_sitemap_lists_static_pages_categories_and_articles():
+    body = sitemap(feeds([article(1, updated_at=NOW + timedelta(days=3))]))
+    assert body.count("<url>") == len(STATIC_PAGES) + 2
+    assert "<loc>https://example.com/category/sleep-rest</loc>" in body
+    assert "<loc>https://example.com/article/article-1</loc><lastmod>2024-05-04</lastmod>" in body
+    assert body.endswith("</urlset>\n")
+
+
+def test_upsert_and_remove_track_publication():
+    subject = feeds([article(1)])
+    subject.upsert_article(article(2))
+    assert "article-2" in sitemap(subject)
+    subject.upsert_article(article(2, published=False))
+    assert "article-2" not in sitemap(subject)
+    subject.remove_article("id-1")
+    assert "article-1" not in sitemap(subject)
+
+
+def test_iter_sitemap_snapshots_before_writes():
+    subject = feeds([article(1)])
+    stream = subject.iter_sitemap(0)
+    subject.upsert_article(article(2))
+    subject.remove_article("id-1")
+    body = b"".join(stream).decode()
+    assert "article-1" in body and "article-2" not in body
+
+
+def test_large_sitemaps_split_into_chunks(monkeypatch):
+    monkeypatch.setattr(site_feeds, "MAX_SITEMAP_URLS", 5)
+    subject = feeds([article(n) for n in range(6)])  # 6 static + 1 category + 6 articles
+    assert subject.sitemap_chunks() == 3
+    assert sum(sitemap(subject, chunk).count("<url>") for chunk in range(3)) == 13
+    index = subject.sitemap_index().decode()
+    assert [line for line in index.splitlines() if "<loc>" in line] == [
+        f"<sitemap><loc>https://example.com/api/sitemap-{n}.xml</loc></sitemap>" for n in (1, 2, 3)
+    ]
+
+
+def test_feed_has_newest_articles_first_and_escapes():
+    subject = feeds([article(n) for n in range(site_feeds.FEED_SIZE + 5)])
+    feed = subject.feed().decode()
+    assert feed.count("<item>") == site_feeds.FEED_SIZE
+    assert feed.index("article-24") < feed.index("article-23")
+    assert "article-4<" not in feed
+    assert "Article 24 &amp; more" in feed and "Why sleep &lt;matters&gt;" in feed
+
+
+def test_feed_cache_invalidated_by_writes():
+    subject = feeds([article(1)])
+    first = subject.feed()
+    assert subject.feed() is first
+    subject.upsert_article(article(2))
+    assert b"article-2" in subject.feed()
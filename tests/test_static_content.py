@@ -0,0 +1,14 @@
+from fastapi.testclient import TestClient
+
+import server
+
+
+def test_unknown_page_is_empty_and_not_cached():
+    client = TestClient(server.app)
+    before = server.compressed_cache.stats()["size"]
+    for n in range(3):
+        response = client.get(f"/api/content/made-up-{n}")
+        assert response.status_code == 200
+        assert response.json() == {"type": f"made-up-{n}", "title": f"Made-Up-{n}", "content": "", "content_html": ""}
+        assert "ETag" not in response.headers
+    assert server.compressed_cache.stats()["size"] == before
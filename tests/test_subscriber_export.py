@@ -0,0 +1,33 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def echo_query(query, export_format):
+        yield json.dumps(query)
+
+    monkeypatch.setattr(server, "stream_subscribers", echo_query)
+    server.app.dependency_overrides[server.get_current_user] = lambda: {"id": "admin"}
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("params,query", [
+    ({}, {"is_active": True}),
+    ({"interest": "sleep-rest"}, {"is_active": True, "interests": "sleep-rest"}),
+    ({"is_active": "false"}, {"is_active": False}),
+    ({"include_inactive": "true"}, {}),
+])
+def test_export_query(client, params, query):
+    response = client.get("/api/subscribers/export", params=params)
+    assert response.status_code == 200
+    assert json.loads(response.text) == query
+
+
+def test_unknown_format_is_a_400(client):
+    assert client.get("/api/subscribers/export", params={"format": "xml"}).status_code == 400
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from starlette.requests import Request
+
+from server import iter_body_lines, parse_import_row
+
+
+def test_strips_email_and_splits_interests():
+    row = parse_import_row({"email": "  reader@example.com ", "interests": "sleep-rest; mental-health;"})
+    assert row.email == "reader@example.com"
+    assert row.interests == ["sleep-rest", "mental-health"]
+    assert row.gdpr_consent is True
+
+
+@pytest.mark.parametrize("value,expected", [("yes", True), ("TRUE", True), ("1", True), ("no", False), ("", False)])
+def test_csv_consent_strings(value, expected):
+    assert parse_import_row({"email": "a@example.com", "gdpr_consent": value}).gdpr_consent is expected
+
+
+def test_ndjson_lists_pass_through():
+    row = parse_import_row({"email": "a@example.com", "interests": ["sleep-rest"], "gdpr_consent": False})
+    assert row.interests == ["sleep-rest"]
+    assert row.gdpr_consent is False
+
+
+@pytest.mark.parametrize("email", [123, ["a@example.com"], {"address": "a@example.com"}, None, "not-an-email"])
+def test_bad_email_is_a_validation_error(email):
+    with pytest.raises(ValidationError):
+        parse_import_row({"email": email})
+
+
+
+def body_lines(chunks):
+    chunks = list(chunks)
+
+    async def receive():
+        return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+
+    async def collect():
+        request = Request({"type": "http", "method": "POST", "headers": []}, receive)
+        return [line async for line in iter_body_lines(request)]
+
+    return asyncio.run(collect())
+
+
+def test_body_lines_strip_a_utf8_bom():
+    body = "\ufeffemail,interests\r\nzoë@example.com,sleep\r\n".encode("utf-8")
+    assert body_lines([body]) == ["email,interests", "zoë@example.com,sleep"]
+
+
+def test_body_lines_survive_chunks_split_inside_bom_and_characters():
+    body = "\ufeffemail\nzoë@example.com".encode("utf-8")
+    split = [body[:2], body[2:12], body[12:]]  # inside the BOM, then inside "ë"
+    assert body_lines(split) == ["email", "zoë@example.com"]
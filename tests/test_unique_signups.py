@@ -0,0 +1,65 @@
+import pytest
+from fastapi import HTTPException
+
+import server
+from server import SubscriberCreate, UserCreate
+
+ADMIN = {"id": "admin"}
+
+
+def test_subscribe_inserts_rejects_duplicates_and_reactivates(mongo_db):
+    async def test(db):
+        first = await server.create_subscriber(SubscriberCreate(email="reader@example.com", interests=["sleep"]))
+        with pytest.raises(HTTPException) as excinfo:
+            await server.create_subscriber(SubscriberCreate(email="reader@example.com"))
+        assert excinfo.value.status_code == 400
+        assert excinfo.value.detail == "Email already subscribed"
+
+        await server.unsubscribe(first["id"], current_user=ADMIN)
+        again = await server.create_subscriber(SubscriberCreate(email="reader@example.com", interests=["stress"]))
+        documents = await db.subscribers.find({"email": "reader@example.com"}, {"_id": 0}).to_list(None)
+        counters = await db.counters.find_one({"_id": server.COUNTERS_ID})
+        return first, again, documents, counters["total_subscribers"]
+
+    first, again, documents, total = mongo_db(test)
+    assert first["is_active"] and again["is_active"]
+    assert again["id"] == first["id"]
+    assert again["interests"] == ["stress"]
+    assert len(documents) == 1
+    assert total == 1
+
+
+def test_register_rejects_a_taken_email(mongo_db):
+    async def test(db):
+        await server.register(UserCreate(email="editor@example.com", name="Editor", password="secret"))
+        with pytest.raises(HTTPException) as excinfo:
+            await server.register(UserCreate(email="editor@example.com", name="Someone", password="other"))
+        assert excinfo.value.status_code == 400
+        return await db.users.count_documents({"email": "editor@example.com"})
+
+    assert mongo_db(test) == 1
+
+
+def test_duplicates_are_rejected_without_the_unique_index(mongo_db):
+    async def test(db):
+        await db.subscribers.drop_index("email_unique")
+        await db.users.drop_index("email_unique")
+        server.missing_unique_indexes.update({("subscribers", "email_unique"), ("users", "email_unique")})
+        try:
+            await server.create_subscriber(SubscriberCreate(email="reader@example.com"))
+            await server.register(UserCreate(email="editor@example.com", name="Editor", password="secret"))
+            for signup in (
+                lambda: server.create_subscriber(SubscriberCreate(email="reader@example.com")),
+                lambda: server.register(UserCreate(email="editor@example.com", name="Editor", password="secret")),
+            ):
+                with pytest.raises(HTTPException) as excinfo:
+                    await signup()
+                assert excinfo.value.status_code == 400
+        finally:
+            server.missing_unique_indexes.clear()
+        return (
+            await db.subscribers.count_documents({"email": "reader@example.com"}),
+            await db.users.count_documents({"email": "editor@example.com"}),
+        )
+
+    assert mongo_db(test) == (1, 1)
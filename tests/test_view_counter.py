@@ -0,0 +1,58 @@
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+import server
+from server import ViewCounterBuffer
+
+
+def test_failed_flush_puts_the_counts_back(monkeypatch):
+    buffer = ViewCounterBuffer(interval_seconds=60)
+
+    async def main():
+        # Nothing listens on port 1, so the bulk write fails for real
+        client = AsyncIOMotorClient("mongodb://127.0.0.1:1", serverSelectionTimeoutMS=100)
+        monkeypatch.setattr(server, "db", client["unreachable"])
+        try:
+            for slug in ("sleep", "sleep", "stress"):
+                buffer.record(slug)
+            await buffer.flush()
+            buffer.record("sleep")
+            await buffer.flush()
+        finally:
+            client.close()
+
+    asyncio.run(main())
+    stats = buffer.stats()
+    assert stats["pending_articles"] == 2
+    assert stats["pending_views"] == 4
+    assert buffer._pending == {"sleep": 3, "stress": 1}
+    assert buffer.failed_flushes == 2
+    assert buffer.flushes == 0
+    assert buffer.flushed_views == 0
+
+
+def test_discard_forgets_buffered_views():
+    buffer = ViewCounterBuffer(interval_seconds=60)
+    buffer.record("deleted")
+    buffer.record("kept")
+    buffer.discard("deleted")
+    buffer.discard("never-viewed")
+    assert buffer._pending == {"kept": 1}
+
+
+def test_flush_writes_views_and_counts_only_matched_articles(mongo_db):
+    buffer = ViewCounterBuffer(interval_seconds=60)
+
+    async def test(db):
+        await db.articles.insert_one({"id": "1", "slug": "sleep", "views": 5})
+        for slug in ("sleep", "sleep", "gone"):
+            buffer.record(slug)
+        await buffer.flush()
+        article = await db.articles.find_one({"slug": "sleep"})
+        counters = await db.counters.find_one({"_id": server.COUNTERS_ID})
+        return article["views"], counters["total_views"]
+
+    assert mongo_db(test) == (7, 2)
+    assert buffer.stats()["pending_views"] == 0
+    assert buffer.flushed_views == 2
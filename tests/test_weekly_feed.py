@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import server
+from server import WEEKLY_WINDOW, WeeklyFeed
+
+# BSON dates keep milliseconds only
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def article(slug: str, age: timedelta, is_published: bool = True) -> dict:
+    return {"id": slug, "slug": slug, "title": slug, "is_published": is_published, "updated_at": NOW - age}
+
+
+def test_expires_when_its_oldest_article_leaves_the_window(mongo_db):
+    feed = WeeklyFeed(max_age=timedelta(days=2))
+
+    async def test(db):
+        await db.articles.insert_many([
+            article("new", timedelta(hours=1)),
+            article("old", timedelta(days=6)),
+            article("draft", timedelta(hours=2), is_published=False),
+            article("stale", timedelta(days=8)),
+        ])
+        await feed._refresh(NOW)
+        return [art["slug"] for art in feed._articles]
+
+    assert mongo_db(test) == ["new", "old"]
+    assert feed._expires_at == NOW - timedelta(days=6) + WEEKLY_WINDOW
+    assert feed._fresh(NOW + timedelta(hours=23))
+    assert not feed._fresh(NOW + timedelta(days=1))
+
+
+def test_expires_after_max_age_when_nothing_ages_out_sooner(mongo_db):
+    feed = WeeklyFeed(max_age=timedelta(minutes=10))
+
+    async def test(db):
+        await db.articles.insert_one(article("new", timedelta(hours=1)))
+        await feed._refresh(NOW)
+
+    mongo_db(test)
+    assert feed._expires_at == NOW + timedelta(minutes=10)
+    assert not feed._fresh(NOW + timedelta(minutes=10))
+
+
+def test_article_writes_force_a_recompute(mongo_db):
+    feed = WeeklyFeed(max_age=timedelta(hours=1))
+
+    async def test(db):
+        await db.articles.insert_one(article("first", timedelta(hours=1)))
+        first = await feed.get()
+        assert await feed.get() is first
+        assert feed.generation == 1
+
+        await db.articles.insert_one(article("second", timedelta(minutes=1)))
+        assert await feed.get() is first
+        server.content_versions.bump("articles")
+        return [art["slug"] for art in await feed.get()]
+
+    assert mongo_db(test) == ["second", "first"]
+    assert feed.generation == 2